@@ -2,42 +2,141 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from typing import Final
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.loader import async_get_loaded_integration
 
-from .const import CONF_ENABLE_HOT_WATER
-from .jg_client import JGClient
+from .const import DOMAIN
+from .coordinator import (
+    JGAuraClimateCoordinator,
+    JGAuraConfigEntry,
+    JGAuraHotWaterCoordinator,
+    JGAuraRuntimeData,
+    climate_poll_interval,
+    hot_water_enabled,
+)
+from .registry import async_get_client_registry
+from .services import async_setup_services
+from .snapshot import SnapshotStore
+from .websocket import async_setup_websocket
 
-type JGAuraConfigEntry = ConfigEntry[JGClient]
+__all__ = ["JGAuraConfigEntry"]
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: Final = [Platform.CLIMATE, Platform.SWITCH]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def _platforms_for_entry(entry: JGAuraConfigEntry) -> list[Platform]:
+    """Return the platforms enabled for a config entry."""
+    if not hot_water_enabled(entry):
+        return [Platform.CLIMATE]
+    return PLATFORMS
+
+
+def _loaded_platforms(entry: JGAuraConfigEntry) -> list[Platform]:
+    """Return the platforms currently set up for a loaded config entry."""
+    if entry.runtime_data.hot_water is None:
+        return [Platform.CLIMATE]
+    return PLATFORMS
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the JGAura services and websocket commands."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: JGAuraConfigEntry) -> bool:
     """Set up JGAura from a config entry."""
-    client = JGClient(
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(
         entry.data["host"],
         entry.data["email"],
         entry.data["password"],
     )
-    entry.runtime_data = client
+    entry.async_on_unload(lambda: registry.async_release(client))
+    platforms_to_setup = _platforms_for_entry(entry)
 
-    platforms_to_setup = PLATFORMS
-    if not entry.data.get(CONF_ENABLE_HOT_WATER, True):
-        platforms_to_setup = [Platform.CLIMATE]
+    snapshots = SnapshotStore()
+    climate = JGAuraClimateCoordinator(hass, entry, client, snapshots)
+    hot_water = (
+        JGAuraHotWaterCoordinator(hass, entry, client, snapshots)
+        if Platform.SWITCH in platforms_to_setup
+        else None
+    )
+    entry.runtime_data = JGAuraRuntimeData(client, snapshots, climate, hot_water)
+
+    # Import the platform modules while the first fetch is waiting on the network,
+    # then forward once every coordinator holds data.
+    first_refreshes = [climate.async_config_entry_first_refresh()]
+    if hot_water is not None:
+        first_refreshes.append(hot_water.async_config_entry_first_refresh())
+    await asyncio.gather(
+        async_get_loaded_integration(hass, DOMAIN).async_get_platforms(
+            platforms_to_setup
+        ),
+        *first_refreshes,
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, platforms_to_setup)
 
+    climate.async_start_polling()
+    if hot_water is not None:
+        hot_water.async_start_polling()
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: JGAuraConfigEntry) -> None:
+    """Apply changed options to the running entry without reloading it.
+
+    The client, its login and the thermostat data are kept; only the poll
+    interval changes and the switch platform is set up or unloaded.
+    """
+    runtime_data = entry.runtime_data
+    runtime_data.climate.async_set_poll_interval(climate_poll_interval(entry))
+
+    if hot_water_enabled(entry) and runtime_data.hot_water is None:
+        hot_water = JGAuraHotWaterCoordinator(
+            hass, entry, runtime_data.client, runtime_data.snapshots
+        )
+        await hot_water.async_refresh()
+        if not hot_water.last_update_success:
+            _LOGGER.warning("Could not fetch hot water data, reloading the entry")
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+        runtime_data.hot_water = hot_water
+        await hass.config_entries.async_forward_entry_setups(entry, [Platform.SWITCH])
+        hot_water.async_start_polling()
+
+    elif not hot_water_enabled(entry) and runtime_data.hot_water is not None:
+        runtime_data.hot_water.async_stop_polling()
+        await hass.config_entries.async_unload_platforms(entry, [Platform.SWITCH])
+        runtime_data.hot_water = None
+        runtime_data.snapshots.async_update_hot_water(None)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: JGAuraConfigEntry) -> bool:
     """Unload a config entry."""
-    platforms_to_unload = PLATFORMS
-    if not entry.data.get(CONF_ENABLE_HOT_WATER, True):
-        platforms_to_unload = [Platform.CLIMATE]
-
-    return await hass.config_entries.async_unload_platforms(entry, platforms_to_unload)
+    runtime_data = entry.runtime_data
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, _loaded_platforms(entry)
+    )
+    if unload_ok:
+        runtime_data.climate.async_stop_polling()
+        if runtime_data.hot_water is not None:
+            runtime_data.hot_water.async_stop_polling()
+        runtime_data.snapshots.async_close()
+    return unload_ok
@@ -0,0 +1,270 @@
+"""Command line interface for the JGAura client.
+
+Runs the same JGClient used by the integration outside of Home Assistant::
+
+    python -m custom_components.jg_aura --email me@example.com watch
+    python -m custom_components.jg_aura --email me@example.com set commands.jsonl
+    python -m custom_components.jg_aura --email me@example.com bench -n 50
+
+The password is read from ``JG_AURA_PASSWORD`` unless ``--password`` is given,
+and ``--host`` can point at a local stand-in server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict
+from datetime import UTC, datetime
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, TextIO
+
+import aiohttp
+
+from . import codec
+from .const import DEFAULT_API_HOST
+from .jg_client import DEFAULT_MAX_RESPONSE_BYTES, JGClient, ZoneOfflineError
+
+
+def _emit(record: dict[str, Any], stream: TextIO | None = None) -> None:
+    """Write one newline-delimited JSON record, to stdout by default."""
+    stream = stream or sys.stdout
+    stream.write(json.dumps(record) + "\n")
+    stream.flush()
+
+
+def _timestamp() -> str:
+    """Return the current time as an ISO 8601 string."""
+    return datetime.now(UTC).isoformat()
+
+
+async def _watch(client: JGClient, args: argparse.Namespace) -> int:
+    """Stream decoded snapshots until interrupted or ``--count`` is reached.
+
+    A cycle that fails is reported as an ``error`` record and the next cycle
+    runs as scheduled.
+    """
+    cycle = 0
+    while args.count is None or cycle < args.count:
+        if cycle:
+            await asyncio.sleep(args.interval)
+        cycle += 1
+        try:
+            gateway = await client.get_thermostats()
+            _emit({"time": _timestamp(), "type": "thermostats", **asdict(gateway)})
+            if args.hot_water:
+                hot_water = await client.get_hot_water()
+                _emit({"time": _timestamp(), "type": "hot_water", **asdict(hot_water)})
+        except Exception as err:
+            _emit(
+                {
+                    "time": _timestamp(),
+                    "type": "error",
+                    "error": f"{type(err).__name__}: {err}",
+                }
+            )
+    return 0
+
+
+def _encode_command(command: dict[str, Any]) -> tuple[str, str]:
+    """Encode one command read from a command file."""
+    device_id = command["device"]
+    if "temperature" in command:
+        return codec.encode_set_point(device_id, float(command["temperature"]))
+    if "preset" in command:
+        return codec.encode_preset(device_id, command["preset"])
+    if "hot_water" in command:
+        return codec.encode_hot_water(device_id, bool(command["hot_water"]))
+    raise ValueError(f"Command has no temperature, preset or hot_water: {command}")
+
+
+def _targets_thermostat(command: dict[str, Any]) -> bool:
+    """Return whether a command changes a thermostat rather than hot water."""
+    return "temperature" in command or "preset" in command
+
+
+def _read_commands(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Parse JSON commands, one per line, skipping blanks and comments."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield json.loads(line)
+
+
+async def _set(client: JGClient, args: argparse.Namespace) -> int:
+    """Send the commands in a file, batching several per request.
+
+    Thermostat commands to zones the gateway reports as offline are reported
+    as ``error`` records and not sent.
+    """
+    if args.file == "-":
+        commands = list(_read_commands(sys.stdin))
+    else:
+        with open(args.file, encoding="utf-8") as file:
+            commands = list(_read_commands(file))
+    encoded = [(command, _encode_command(command)) for command in commands]
+
+    # Offline zones are only known from a snapshot, so take one first.
+    if any(_targets_thermostat(command) for command in commands):
+        await client.get_thermostats()
+    sendable: list[tuple[str, str]] = []
+    for command, attribute in encoded:
+        if _targets_thermostat(command):
+            try:
+                client.check_zone_online(command["device"])
+            except ZoneOfflineError as err:
+                _emit({"time": _timestamp(), "type": "error", "error": str(err)})
+                continue
+        sendable.append(attribute)
+
+    for start in range(0, len(sendable), args.batch_size):
+        batch = sendable[start : start + args.batch_size]
+        began = time.perf_counter()
+        await client.send_commands(batch)
+        _emit(
+            {
+                "time": _timestamp(),
+                "type": "set",
+                "commands": len(batch),
+                "latency": time.perf_counter() - began,
+            }
+        )
+    return 0
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of an ordered list."""
+    rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+async def _bench(client: JGClient, args: argparse.Namespace) -> int:
+    """Time repeated device polls and report latency percentiles."""
+    request = client.get_hot_water if args.hot_water else client.get_thermostats
+    # The first request logs in, so it is not part of the measurement.
+    await request()
+
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def _timed() -> None:
+        async with semaphore:
+            began = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - began)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(_timed() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - began
+
+    latencies.sort()
+    _emit(
+        {
+            "time": _timestamp(),
+            "type": "bench",
+            "requests": len(latencies),
+            "concurrency": args.concurrency,
+            "elapsed": elapsed,
+            "mean": sum(latencies) / len(latencies),
+            "p50": _percentile(latencies, 50),
+            "p90": _percentile(latencies, 90),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1],
+        }
+    )
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.jg_aura",
+        description="Watch, script and benchmark a JG Aura gateway.",
+    )
+    parser.add_argument("--host", default=DEFAULT_API_HOST, help="API host URL")
+    parser.add_argument("--email", required=True, help="account email")
+    parser.add_argument(
+        "--password",
+        default=os.environ.get("JG_AURA_PASSWORD"),
+        help="account password (default: $JG_AURA_PASSWORD)",
+    )
+    parser.add_argument(
+        "--max-response-bytes",
+        type=_positive_int,
+        default=DEFAULT_MAX_RESPONSE_BYTES,
+        help="reject larger responses (default: %(default)s)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    watch = commands.add_parser("watch", help="stream snapshots as JSON lines")
+    watch.add_argument("--interval", type=float, default=30, help="seconds")
+    watch.add_argument(
+        "--count", type=_positive_int, help="stop after this many cycles"
+    )
+    watch.add_argument(
+        "--no-hot-water", dest="hot_water", action="store_false", help="skip hot water"
+    )
+    watch.set_defaults(handler=_watch)
+
+    set_ = commands.add_parser("set", help="send JSON line commands from a file")
+    set_.add_argument("file", help="command file, or - for stdin")
+    set_.add_argument(
+        "--batch-size", type=_positive_int, default=10, help="commands per request"
+    )
+    set_.set_defaults(handler=_set)
+
+    bench = commands.add_parser("bench", help="report poll latency percentiles")
+    bench.add_argument("-n", "--requests", type=_positive_int, default=20)
+    bench.add_argument("-c", "--concurrency", type=_positive_int, default=1)
+    bench.add_argument(
+        "--hot-water", action="store_true", help="poll hot water instead"
+    )
+    bench.set_defaults(handler=_bench)
+
+    args = parser.parse_args(argv)
+    if args.password is None:
+        parser.error("--password or JG_AURA_PASSWORD is required")
+    return args
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """Run the selected mode with a client sharing one HTTP session."""
+    async with aiohttp.ClientSession() as session:
+        client = JGClient(
+            args.host,
+            args.email,
+            args.password,
+            max_response_bytes=args.max_response_bytes,
+            session=session,
+        )
+        return await args.handler(client, args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface."""
+    args = _parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING, stream=sys.stderr
+    )
+    try:
+        return asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import timedelta
 import logging
 from typing import Any, ClassVar
 
@@ -15,16 +13,12 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import jg_client, thermostat
-from .__init__ import JGAuraConfigEntry
-from .const import CONF_REFRESH_RATE
+from . import jg_client, profiler, thermostat
+from .coordinator import JGAuraClimateCoordinator, JGAuraConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,36 +29,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the climate platform from a config entry."""
-    client = entry.runtime_data
-    refresh_rate = entry.data.get(CONF_REFRESH_RATE, 30)
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.climate
 
     thermostat_entities: list[JGAuraThermostat] = []
 
-    async def async_update_data() -> jg_client.gateway.Gateway:
-        """Update data from the API."""
-        try:
-            return await client.get_thermostats()
-        except Exception as err:
-            raise UpdateFailed(f"Failed to update thermostat data: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="climate",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=refresh_rate),
-        config_entry=entry,
-    )
-
-    await coordinator.async_config_entry_first_refresh()
-
     def update_entities() -> None:
         """Update all entities when coordinator updates."""
-        for entity in thermostat_entities:
-            for therm in coordinator.data.thermostats:
-                if therm.id == entity.id:
-                    entity.set_values(therm)
-                    entity.async_write_ha_state()
+        with profiler.measure(client.profiler, profiler.CATEGORY_STATE_WRITE):
+            for entity in thermostat_entities:
+                for therm in coordinator.data.thermostats:
+                    if therm.id == entity.id:
+                        entity.set_values(therm)
+                        entity.async_write_ha_state()
 
     coordinator.async_add_listener(update_entities)
 
@@ -94,7 +71,7 @@ class JGAuraThermostat(CoordinatorEntity, ClimateEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: JGAuraClimateCoordinator,
         client: jg_client.JGClient,
         gateway_id: str,
         device_id: str,
@@ -114,12 +91,18 @@ class JGAuraThermostat(CoordinatorEntity, ClimateEntity):
         self._preset_mode: str = "Low"
         self._hvac_mode = HVACMode.HEAT
         self._hvac_action = HVACAction.HEATING if is_on else HVACAction.IDLE
+        self._online = True
 
     @property
     def id(self) -> str:
         """Return the thermostat ID."""
         return self._id
 
+    @property
+    def available(self) -> bool:
+        """Return whether the thermostat is reachable."""
+        return super().available and self._online
+
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -155,25 +138,35 @@ class JGAuraThermostat(CoordinatorEntity, ClimateEntity):
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
+        self._raise_if_offline()
 
         self._target_temp = temperature
-        await self._client.set_thermostat_temperature(self._id, temperature)
-        self.async_write_ha_state()
+        async with profiler.cycle(self._client.profiler, "set temperature"):
+            await self._client.set_thermostat_temperature(self._id, temperature)
+            with profiler.measure(self._client.profiler, profiler.CATEGORY_STATE_WRITE):
+                self.async_write_ha_state()
 
-        await asyncio.sleep(jg_client.API_DELAY_SECONDS)
         await self.coordinator.async_request_refresh()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
+        self._raise_if_offline()
         self._preset_mode = preset_mode
-        await self._client.set_thermostat_preset(self._id, preset_mode)
-        self.async_write_ha_state()
+        async with profiler.cycle(self._client.profiler, "set preset"):
+            await self._client.set_thermostat_preset(self._id, preset_mode)
+            with profiler.measure(self._client.profiler, profiler.CATEGORY_STATE_WRITE):
+                self.async_write_ha_state()
 
-        await asyncio.sleep(jg_client.API_DELAY_SECONDS)
         await self.coordinator.async_request_refresh()
 
+    def _raise_if_offline(self) -> None:
+        """Fail a command without contacting the API if the zone is offline."""
+        if not self._online:
+            raise HomeAssistantError(f"Thermostat {self.name} is offline")
+
     def set_values(self, therm: thermostat.Thermostat) -> None:
         """Update entity values from thermostat data."""
+        self._online = therm.online
         self._current_temp = therm.temp_current
         self._target_temp = therm.temp_set_point
         self._preset_mode = therm.state_name
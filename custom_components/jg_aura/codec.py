@@ -0,0 +1,213 @@
+"""Encoding and decoding of the Aura wire protocol.
+
+The gateway packs state into printable characters offset by 32. Summary
+attributes (``001``-``003``) hold back-to-back 8 character blocks made of a
+4 character zone id followed by a 4 character status, and commands are sent as
+``!<zone id><payload>`` values of ``setMultiDeviceAttributes2`` attributes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+import urllib.parse
+
+CHAR_OFFSET = 32
+BLOCK_SIZE = 8
+ID_SIZE = 4
+
+ATTR_REFRESH = "B01"
+ATTR_MODE = "B05"
+ATTR_SET_POINT = "B06"
+REFRESH_VALUE = "5"
+
+SUMMARY_ATTRIBUTES = ("001", "002", "003")
+DISPLAY_ATTRIBUTES = ("S02", "S03")
+HOT_WATER_ID_ATTRIBUTE_ID = "2272"
+HOT_WATER_SUMMARY_ATTRIBUTE_ID = "2257"
+
+# Attributes each platform reads from getDeviceAttributesWithValues. Thermostat
+# attributes are matched by name and hot water attributes by id.
+THERMOSTAT_ATTRIBUTES = frozenset(SUMMARY_ATTRIBUTES + DISPLAY_ATTRIBUTES)
+HOT_WATER_ATTRIBUTES = frozenset(
+    (HOT_WATER_ID_ATTRIBUTE_ID, HOT_WATER_SUMMARY_ATTRIBUTE_ID)
+)
+
+RUN_MODES = [
+    "Auto",
+    "High",
+    "Medium",
+    "Low",
+    "Party",
+    "Away",
+    "Frost",
+]
+RUN_MODES_WITH_DURATION = [
+    "Party",
+    "Away",
+]
+HEATING_MODES = [
+    "Auto",
+    "High",
+    "Medium",
+    "Low",
+    "Party",
+]
+
+OFFLINE_MODE = "OFFLINE"
+
+# There are more modes than actual presets. However, if a mode does not match
+# a preset HA can show the mode, but the preset is left blank. As such, make
+# sure the values match the 'preset' you want to display.
+MODES = [
+    "OFFLINE",
+    "Auto",  # Auto High
+    "Auto",  # Auto Medium
+    "Auto",  # Auto Low
+    "High",
+    "Medium",
+    "Low",
+    "Party",
+    "Away",
+    "Frost",
+    "ON",
+    "ON",
+    "UNDEFINED",
+    "UNDEFINED",
+    "UNDEFINED",
+    "UNDEFINED",
+    "OFFLINE",
+    "Auto",  # Auto High
+    "Auto",  # Auto Medium
+    "Auto",  # Auto Low
+    "High",
+    "Medium",
+    "Low",
+    "Party",
+    "Frost",
+    "ON",
+]
+
+# Codes above this value mean the zone is calling for heat.
+_HEATING_THRESHOLD = 9
+
+_PRESET_DURATION = "01"
+_PRESET_FIRST_CODE = 35
+_HOT_WATER_ON = "# "
+_HOT_WATER_OFF = "$ "
+_HOT_WATER_ON_STATE = "3"
+
+
+class ZoneStatus(NamedTuple):
+    """Decoded status block of a single zone."""
+
+    state_name: str
+    on: bool
+    temp_current: float
+    temp_set_point: float
+
+
+# Lookup tables indexed by character code, built once at import time so that
+# decoding a block is a handful of tuple lookups.
+_MODE_BY_CODE: tuple[str | None, ...] = tuple(
+    MODES[code - CHAR_OFFSET] if 0 <= code - CHAR_OFFSET < len(MODES) else None
+    for code in range(256)
+)
+_ON_BY_CODE: tuple[bool, ...] = tuple(
+    code - CHAR_OFFSET > _HEATING_THRESHOLD for code in range(256)
+)
+_HALF_DEGREES_BY_CODE: tuple[float, ...] = tuple(
+    (code - CHAR_OFFSET) * 0.5 for code in range(256)
+)
+_CHAR_BY_HALF_DEGREES: dict[int, str] = {
+    half_degrees: chr(half_degrees + CHAR_OFFSET)
+    for half_degrees in range(256 - CHAR_OFFSET)
+}
+_PRESET_PAYLOADS: dict[str, str] = {
+    mode: chr(index + _PRESET_FIRST_CODE)
+    + (_PRESET_DURATION if mode in RUN_MODES_WITH_DURATION else "")
+    for index, mode in enumerate(RUN_MODES)
+}
+
+
+def unescape(value: str) -> str:
+    """Undo the extra XML escaping the API applies to attribute values."""
+    return value.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+
+
+def decode_status(status: str) -> ZoneStatus:
+    """Decode the 4 character status part of a summary block."""
+    mode_code = ord(status[1])
+    state_name = _MODE_BY_CODE[mode_code] if mode_code < 256 else None
+    if state_name is None:
+        raise ValueError(f"Unknown mode code {mode_code - CHAR_OFFSET}")
+    return ZoneStatus(
+        state_name,
+        _ON_BY_CODE[mode_code],
+        _HALF_DEGREES_BY_CODE[ord(status[2])],
+        _HALF_DEGREES_BY_CODE[ord(status[3])],
+    )
+
+
+def split_blocks(buffer: str) -> dict[str, str]:
+    """Split a summary buffer into a mapping of zone id to raw status."""
+    end = len(buffer) - len(buffer) % BLOCK_SIZE
+    return {
+        buffer[i : i + ID_SIZE]: buffer[i + ID_SIZE : i + BLOCK_SIZE]
+        for i in range(0, end, BLOCK_SIZE)
+    }
+
+
+def decode_summaries(buffers: Iterable[str]) -> dict[str, str]:
+    """Split every summary buffer, later buffers overriding earlier ones."""
+    blocks: dict[str, str] = {}
+    for buffer in buffers:
+        blocks.update(split_blocks(buffer))
+    return blocks
+
+
+def decode_names(buffer: str) -> list[tuple[str, str]]:
+    """Decode a display attribute into ``(zone id, name)`` pairs."""
+    return [
+        (item[:ID_SIZE], item[ID_SIZE:])
+        for item in buffer.split(",")
+        if len(item) > ID_SIZE
+    ]
+
+
+def decode_hot_water(summary: str, hot_water_id: str) -> bool:
+    """Return whether hot water is on according to its summary buffer."""
+    for i in range(0, len(summary), BLOCK_SIZE):
+        block = summary[i : i + BLOCK_SIZE]
+        if hot_water_id in block:
+            return block[: len(hot_water_id) + 2].endswith(_HOT_WATER_ON_STATE)
+    return False
+
+
+def encode_set_point(device_id: str, temperature: float) -> tuple[str, str]:
+    """Encode a target temperature command."""
+    char = _CHAR_BY_HALF_DEGREES.get(int(temperature * 2))
+    if char is None:
+        raise ValueError(f"Temperature {temperature} cannot be encoded")
+    return ATTR_SET_POINT, f"!{device_id}{char}"
+
+
+def encode_preset(device_id: str, state_name: str) -> tuple[str, str]:
+    """Encode a preset mode command."""
+    payload = _PRESET_PAYLOADS.get(state_name)
+    if payload is None:
+        raise ValueError(f"Unknown preset {state_name}")
+    return ATTR_MODE, f"!{device_id}{payload}"
+
+
+def encode_hot_water(device_id: str, is_on: bool) -> tuple[str, str]:
+    """Encode a hot water on/off command."""
+    return ATTR_MODE, f"!{device_id}{_HOT_WATER_ON if is_on else _HOT_WATER_OFF}"
+
+
+def encode_commands(commands: Iterable[tuple[str, str]]) -> str:
+    """Encode commands as numbered ``nameN``/``valueN`` query parameters."""
+    return "".join(
+        f"&name{index}={name}&value{index}={urllib.parse.quote(value)}"
+        for index, (name, value) in enumerate(commands, start=1)
+    )
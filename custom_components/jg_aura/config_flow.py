@@ -9,7 +9,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_HOST, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
@@ -18,11 +18,14 @@ from .const import (
     DEFAULT_API_HOST,
     DEFAULT_REFRESH_RATE,
     DOMAIN,
+    MIN_REFRESH_RATE,
 )
-from .jg_client import JGClient
+from .registry import async_get_client_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+REFRESH_RATE_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=MIN_REFRESH_RATE))
+
 
 class InvalidAuthError(HomeAssistantError):
     """Error to indicate there is invalid auth."""
@@ -32,7 +35,8 @@ async def _async_validate_input(
     hass: HomeAssistant, data: dict[str, Any]
 ) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    client = JGClient(
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(
         data.get(CONF_HOST, DEFAULT_API_HOST),
         data[CONF_EMAIL],
         data[CONF_PASSWORD],
@@ -43,6 +47,8 @@ async def _async_validate_input(
     except Exception as err:
         _LOGGER.error("Failed to validate credentials: %s", err)
         raise InvalidAuthError(f"Invalid credentials: {err}") from err
+    finally:
+        registry.async_release(client)
 
     return {"title": f"JGAura ({data[CONF_EMAIL]})"}
 
@@ -52,6 +58,14 @@ class JGAuraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> JGAuraOptionsFlow:
+        """Get the options flow for this handler."""
+        return JGAuraOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -77,7 +91,9 @@ class JGAuraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_HOST, default=DEFAULT_API_HOST): str,
                 vol.Required(CONF_EMAIL): str,
                 vol.Required(CONF_PASSWORD): str,
-                vol.Optional(CONF_REFRESH_RATE, default=DEFAULT_REFRESH_RATE): int,
+                vol.Optional(
+                    CONF_REFRESH_RATE, default=DEFAULT_REFRESH_RATE
+                ): REFRESH_RATE_SCHEMA,
                 vol.Optional(CONF_ENABLE_HOT_WATER, default=True): bool,
             }
         )
@@ -103,7 +119,9 @@ class JGAuraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected error during reauth validation")
                 errors["base"] = "cannot_connect"
             else:
-                self.hass.config_entries.async_update_entry(entry, data=user_input)
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, **user_input}
+                )
                 await self.hass.config_entries.async_reload(entry.entry_id)
                 return self.async_abort_flow(reason="reauth_successful")
 
@@ -115,14 +133,6 @@ class JGAuraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ): str,
                 vol.Required(CONF_EMAIL, default=current_data.get(CONF_EMAIL)): str,
                 vol.Required(CONF_PASSWORD): str,
-                vol.Optional(
-                    CONF_REFRESH_RATE,
-                    default=current_data.get(CONF_REFRESH_RATE, DEFAULT_REFRESH_RATE),
-                ): int,
-                vol.Optional(
-                    CONF_ENABLE_HOT_WATER,
-                    default=current_data.get(CONF_ENABLE_HOT_WATER, True),
-                ): bool,
             }
         )
 
@@ -132,3 +142,40 @@ class JGAuraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={"email": current_data.get(CONF_EMAIL)},
         )
+
+
+class JGAuraOptionsFlow(config_entries.OptionsFlow):
+    """Handle JGAura options.
+
+    Options are applied to the running entry by its update listener, so saving
+    them does not reload the entry or log in again.
+    """
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        entry = self.config_entry
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_REFRESH_RATE,
+                    default=entry.options.get(
+                        CONF_REFRESH_RATE,
+                        entry.data.get(CONF_REFRESH_RATE, DEFAULT_REFRESH_RATE),
+                    ),
+                ): REFRESH_RATE_SCHEMA,
+                vol.Optional(
+                    CONF_ENABLE_HOT_WATER,
+                    default=entry.options.get(
+                        CONF_ENABLE_HOT_WATER,
+                        entry.data.get(CONF_ENABLE_HOT_WATER, True),
+                    ),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -6,7 +6,10 @@ DOMAIN = "jg_aura"
 CONF_REFRESH_RATE = "refresh_rate"
 CONF_ENABLE_HOT_WATER = "hot_water"
 
-DEFAULT_REFRESH_RATE = 60
+DEFAULT_REFRESH_RATE = 30
+# Kept well above the poll scheduler's minimum gap between polls, shorter
+# intervals would be stretched by it.
+MIN_REFRESH_RATE = 10
 DEFAULT_API_HOST = "https://emea-salprod02-api.arrayent.com:8081/zdk/services/zamapi"
 
 SCAN_INTERVAL = timedelta(minutes=1)
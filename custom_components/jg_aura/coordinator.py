@@ -0,0 +1,219 @@
+"""Data update coordinators for JGAura integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from . import profiler
+from .const import CONF_ENABLE_HOT_WATER, CONF_REFRESH_RATE, DEFAULT_REFRESH_RATE
+from .gateway import Gateway
+from .hotwater import HotWater
+from .registry import SNAPSHOT_REUSE_SECONDS
+from .scheduler import async_get_poll_scheduler
+from .snapshot import SnapshotStore
+
+if TYPE_CHECKING:
+    from .jg_client import JGClient
+
+_LOGGER = logging.getLogger(__name__)
+
+HOT_WATER_REFRESH_RATE = 60
+# Once a zone goes offline, this many thermostat polls run at most this far
+# apart before falling back to the configured interval. The API has no
+# per-zone endpoint, so polling sooner is how a zone that briefly drops out is
+# picked up again, while a zone that stays offline costs no extra load.
+OFFLINE_ZONE_POLL_INTERVAL = timedelta(seconds=15)
+OFFLINE_ZONE_FAST_POLLS = 8
+
+
+def entry_option(entry: ConfigEntry, key: str, default: Any) -> Any:
+    """Return an option, falling back to the value given at setup."""
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+def climate_poll_interval(entry: ConfigEntry) -> timedelta:
+    """Return the thermostat poll interval configured for an entry."""
+    return timedelta(
+        seconds=entry_option(entry, CONF_REFRESH_RATE, DEFAULT_REFRESH_RATE)
+    )
+
+
+def hot_water_enabled(entry: ConfigEntry) -> bool:
+    """Return whether hot water control is enabled for an entry."""
+    return bool(entry_option(entry, CONF_ENABLE_HOT_WATER, True))
+
+
+@dataclass
+class JGAuraRuntimeData:
+    """Runtime data stored on the config entry."""
+
+    client: JGClient
+    snapshots: SnapshotStore
+    climate: JGAuraClimateCoordinator
+    hot_water: JGAuraHotWaterCoordinator | None
+
+
+type JGAuraConfigEntry = ConfigEntry[JGAuraRuntimeData]
+
+
+class JGAuraCoordinator[_DataT](DataUpdateCoordinator[_DataT]):
+    """Base coordinator polling data from the gateway.
+
+    Polls are driven by the shared PollScheduler every ``poll_interval`` rather
+    than by the coordinator's own timer.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: JGClient,
+        snapshots: SnapshotStore,
+        name: str,
+        poll_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, name=name, config_entry=entry)
+        self.client = client
+        self.snapshots = snapshots
+        self.poll_interval = poll_interval
+        self._unsub_polling: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start_polling(self) -> None:
+        """Start polling on the shared scheduler."""
+        self.async_stop_polling()
+        assert self.config_entry is not None
+        self._unsub_polling = async_get_poll_scheduler(self.hass).async_register(
+            self.config_entry, self, self.poll_interval
+        )
+
+    @callback
+    def async_stop_polling(self) -> None:
+        """Stop polling, cancelling any pending poll."""
+        if self._unsub_polling is not None:
+            self._unsub_polling()
+            self._unsub_polling = None
+
+    @callback
+    def async_set_poll_interval(self, poll_interval: timedelta) -> None:
+        """Change the poll interval, keeping the current data."""
+        if poll_interval == self.poll_interval:
+            return
+        self.poll_interval = poll_interval
+        if self._unsub_polling is not None:
+            self.async_start_polling()
+
+    @property
+    def _snapshot_max_age(self) -> float:
+        """Return how old a shared snapshot may be to serve this refresh.
+
+        Only the first refresh reuses the snapshot a shared client already
+        holds; later refreshes always fetch.
+        """
+        return SNAPSHOT_REUSE_SECONDS if self.data is None else 0
+
+    async def async_refresh(self) -> None:
+        """Refresh data, recording the cycle when a profile is running."""
+        async with profiler.cycle(self.client.profiler, f"{self.name} refresh"):
+            await super().async_refresh()
+
+
+class JGAuraClimateCoordinator(JGAuraCoordinator[Gateway]):
+    """Coordinator polling thermostat data from the gateway."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: JGClient,
+        snapshots: SnapshotStore,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            entry,
+            client,
+            snapshots,
+            "climate",
+            climate_poll_interval(entry),
+        )
+        self._configured_interval = self.poll_interval
+        self._offline_zones: frozenset[str] = frozenset()
+        self._fast_polls_left = 0
+
+    async def _async_update_data(self) -> Gateway:
+        """Update data from the API."""
+        try:
+            gateway = await self.client.get_thermostats(self._snapshot_max_age)
+        except Exception as err:
+            raise UpdateFailed(f"Failed to update thermostat data: {err}") from err
+
+        self.snapshots.async_update_thermostats(gateway)
+        self._async_track_offline_zones(
+            frozenset(therm.id for therm in gateway.thermostats if not therm.online)
+        )
+        return gateway
+
+    @callback
+    def async_set_poll_interval(self, poll_interval: timedelta) -> None:
+        """Change the configured poll interval, keeping the current data.
+
+        The new interval applies straight away, ending any faster polling.
+        """
+        self._configured_interval = poll_interval
+        self._fast_polls_left = 0
+        super().async_set_poll_interval(poll_interval)
+
+    @callback
+    def _async_track_offline_zones(self, offline_zones: frozenset[str]) -> None:
+        """Poll sooner for a few polls after a zone goes offline."""
+        if not offline_zones:
+            self._fast_polls_left = 0
+        elif offline_zones - self._offline_zones:
+            self._fast_polls_left = OFFLINE_ZONE_FAST_POLLS
+        elif self._fast_polls_left:
+            self._fast_polls_left -= 1
+        self._offline_zones = offline_zones
+
+        interval = self._configured_interval
+        if self._fast_polls_left:
+            interval = min(interval, OFFLINE_ZONE_POLL_INTERVAL)
+        super().async_set_poll_interval(interval)
+
+
+class JGAuraHotWaterCoordinator(JGAuraCoordinator[HotWater]):
+    """Coordinator polling hot water data from the gateway."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: JGClient,
+        snapshots: SnapshotStore,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            entry,
+            client,
+            snapshots,
+            "switch",
+            timedelta(seconds=HOT_WATER_REFRESH_RATE),
+        )
+
+    async def _async_update_data(self) -> HotWater:
+        """Update data from the API."""
+        try:
+            hot_water = await self.client.get_hot_water(self._snapshot_max_age)
+        except Exception as err:
+            raise UpdateFailed(f"Failed to update hot water data: {err}") from err
+        self.snapshots.async_update_hot_water(hot_water)
+        return hot_water
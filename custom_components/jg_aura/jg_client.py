@@ -3,232 +3,396 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
 import hashlib
 import logging
-from typing import Any
-import urllib.parse
+import time
 
 import aiohttp
 from defusedxml import ElementTree as ET
 
-from . import gateway, hotwater, thermostat
+from . import codec, gateway, hotwater, profiler, thermostat
+from .codec import HEATING_MODES, MODES, RUN_MODES, RUN_MODES_WITH_DURATION
+
+__all__ = [
+    "HEATING_MODES",
+    "MODES",
+    "RUN_MODES",
+    "RUN_MODES_WITH_DURATION",
+    "JGClient",
+]
 
 _LOGGER = logging.getLogger(__name__)
 
 APPID = "1097"
-RUN_MODES = [
-    "Auto",
-    "High",
-    "Medium",
-    "Low",
-    "Party",
-    "Away",
-    "Frost",
-]
-RUN_MODES_WITH_DURATION = [
-    "Party",
-    "Away",
-]
-HEATING_MODES = [
-    "Auto",
-    "High",
-    "Medium",
-    "Low",
-    "Party",
-]
-
-# There are more modes than actual presets. However, if a mode does not match
-# a preset HA can show the mode, but the preset is left blank. As such, make
-# sure the values match the 'preset' you want to display.
-MODES = [
-    "OFFLINE",
-    "Auto",  # Auto High
-    "Auto",  # Auto Medium
-    "Auto",  # Auto Low
-    "High",
-    "Medium",
-    "Low",
-    "Party",
-    "Away",
-    "Frost",
-    "ON",
-    "ON",
-    "UNDEFINED",
-    "UNDEFINED",
-    "UNDEFINED",
-    "UNDEFINED",
-    "OFFLINE",
-    "Auto",  # Auto High
-    "Auto",  # Auto Medium
-    "Auto",  # Auto Low
-    "High",
-    "Medium",
-    "Low",
-    "Party",
-    "Frost",
-    "ON",
-]
 
 # When setting values through the API, a delay is required to get the updated values,
-# otherwise the API may return stale data.
+# otherwise the API may return stale data. Polls wait this long after the last
+# command completes before requesting device data.
 API_DELAY_SECONDS = 1.5
+# A poll overlapped by a command drops its result and fetches again, at most
+# this many times in all, and waits at most this long for commands to settle,
+# so a steady stream of commands cannot starve polls.
+POLL_MAX_FETCHES = 3
+POLL_MAX_WRITE_WAIT_SECONDS = 10
+
+# Security tokens are renewed in the background once this fraction of their
+# learned lifetime has passed. The lifetime is only learned from requests
+# rejected with these statuses, and rejections sooner than the minimum
+# lifetime after a login are not treated as token expiry.
+TOKEN_REFRESH_MARGIN = 0.9
+AUTH_REJECTED_STATUSES = frozenset((401, 403))
+MIN_TOKEN_LIFETIME_SECONDS = 60
+TOKEN_REFRESH_RETRY_SECONDS = 60
+TOKEN_REFRESH_IDLE_WAIT_SECONDS = 10
+
+# Responses are read in chunks and abandoned once they exceed the cap. Bodies
+# included in error logs are truncated and logged at most once per interval.
+DEFAULT_MAX_RESPONSE_BYTES = 1024 * 1024
+RESPONSE_CHUNK_BYTES = 64 * 1024
+ERROR_LOG_RESPONSE_CHARS = 500
+ERROR_LOG_INTERVAL_SECONDS = 300
+
+
+class ResponseTooLargeError(ValueError):
+    """Error to indicate a response exceeded the size cap."""
+
+
+class ZoneOfflineError(ValueError):
+    """Error to indicate a command targets a zone that is offline."""
 
 
 class JGClient:
     """Client for interacting with JGAura API."""
 
-    def __init__(self, host: str, email: str, password: str) -> None:
-        """Initialize the client."""
+    def __init__(
+        self,
+        host: str,
+        email: str,
+        password: str,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        When no session is given, every request opens its own short-lived one.
+        """
         self.host = host
+        self._session = session
+        self.max_response_bytes = max_response_bytes
         self.email = email
         self.hashed_password = hashlib.md5(password.encode()).hexdigest()
         self.gateway_device_id: str | None = None
         self.logged_in = False
         self.security_token: str | None = None
-
-    async def get_thermostats(self) -> gateway.Gateway:
-        """Get all thermostats from the gateway."""
-        if not self.logged_in:
-            await self._login()
-        return await self._request_devices(self._extract_thermostats)
-
-    async def get_hot_water(self) -> hotwater.HotWater:
-        """Get hot water status from the gateway."""
-        if not self.logged_in:
-            await self._login()
-        return await self._request_devices(self._extract_hot_water)
+        self.token_lifetime: float | None = None
+        self.profiler: profiler.Profiler | None = None
+        self.offline_zones: frozenset[str] = frozenset()
+        self._thermostats_snapshot: tuple[float, gateway.Gateway] | None = None
+        self._hot_water_snapshot: tuple[float, hotwater.HotWater] | None = None
+        self._login_lock = asyncio.Lock()
+        self._logged_in_at: float | None = None
+        self._login_generation = 0
+        self._last_success_at: float | None = None
+        self._token_changed = asyncio.Event()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._error_logged_at: dict[str, float] = {}
+        self._pending_writes = 0
+        self._write_generation = 0
+        self._writes_settled_at = 0.0
+        self._writes_idle = asyncio.Event()
+        self._writes_idle.set()
+        self._suppressed_errors: dict[str, int] = {}
+
+    async def get_thermostats(self, max_age: float = 0) -> gateway.Gateway:
+        """Get all thermostats, reusing a snapshot up to max_age seconds old."""
+        if (cached := self._fresh(self._thermostats_snapshot, max_age)) is not None:
+            return cached
+        await self._ensure_logged_in()
+        result = await self._request_devices(self._extract_thermostats)
+        self.offline_zones = frozenset(
+            therm.id for therm in result.thermostats if not therm.online
+        )
+        self._thermostats_snapshot = (time.monotonic(), result)
+        return result
+
+    async def get_hot_water(self, max_age: float = 0) -> hotwater.HotWater:
+        """Get hot water status, reusing a snapshot up to max_age seconds old."""
+        if (cached := self._fresh(self._hot_water_snapshot, max_age)) is not None:
+            return cached
+        await self._ensure_logged_in()
+        result = await self._request_devices(self._extract_hot_water)
+        self._hot_water_snapshot = (time.monotonic(), result)
+        return result
+
+    def _fresh[_T](
+        self, snapshot: tuple[float, _T] | None, max_age: float
+    ) -> _T | None:
+        """Return the snapshot value if it is at most max_age seconds old."""
+        if not max_age or snapshot is None or time.monotonic() - snapshot[0] > max_age:
+            return None
+        return snapshot[1]
 
     async def set_thermostat_preset(self, device_id: str, state_name: str) -> None:
         """Set thermostat preset mode."""
-        if not self.logged_in:
-            await self._login()
-        await self._set_preset(device_id, state_name)
+        self.check_zone_online(device_id)
+        await self.send_commands([codec.encode_preset(device_id, state_name)])
 
     async def set_thermostat_temperature(
         self, device_id: str, temperature: float
     ) -> None:
         """Set thermostat target temperature."""
-        if not self.logged_in:
-            await self._login()
-        await self._set_temperature(device_id, temperature)
+        self.check_zone_online(device_id)
+        await self.send_commands([codec.encode_set_point(device_id, temperature)])
 
     async def set_hot_water(self, device_id: str, is_on: bool) -> None:
         """Set hot water on or off."""
-        if not self.logged_in:
-            await self._login()
-        await self._set_hot_water(device_id, is_on)
+        await self.send_commands([codec.encode_hot_water(device_id, is_on)])
+
+    async def send_commands(self, commands: list[tuple[str, str]]) -> None:
+        """Send one or more encoded commands in a single request.
+
+        Commands never wait for polls. Polls started before a command have
+        their results dropped, and new polls are held back until the gateway
+        has had time to apply it.
+        """
+        self._pending_writes += 1
+        self._write_generation += 1
+        self._writes_idle.clear()
+        try:
+            await self._ensure_logged_in()
+            result = await self._fetch_url_with_login_retry(
+                "setMultiDeviceAttributes2", codec.encode_commands(commands)
+            )
+            with profiler.measure(self.profiler, profiler.CATEGORY_PARSE):
+                self._validate_operation_response(result)
+        finally:
+            self._pending_writes -= 1
+            self._writes_settled_at = time.monotonic() + API_DELAY_SECONDS
+            if not self._pending_writes:
+                self._writes_idle.set()
+
+    def check_zone_online(self, device_id: str) -> None:
+        """Fail without a request if the last snapshot showed the zone offline."""
+        if device_id in self.offline_zones:
+            raise ZoneOfflineError(f"Zone {device_id} is offline")
+
+    async def _wait_for_writes(self) -> None:
+        """Wait until no command is in flight and the last one has settled."""
+        while True:
+            await self._writes_idle.wait()
+            delay = self._writes_settled_at - time.monotonic()
+            if delay <= 0 and self._writes_idle.is_set():
+                return
+            await asyncio.sleep(max(delay, 0))
+
+    async def run_token_refresh(self) -> None:
+        """Re-authenticate ahead of the learned token expiry until cancelled.
+
+        The token lifetime is only known once an expiry has been observed, until
+        then this waits and the client keeps re-logging in on failed requests.
+        A failed refresh of any kind is logged and retried, so only cancellation
+        ends the loop.
+        """
+        while True:
+            self._token_changed.clear()
+            delay = self._seconds_until_token_refresh()
+            if delay is None:
+                await self._token_changed.wait()
+                continue
+            try:
+                async with asyncio.timeout(delay):
+                    await self._token_changed.wait()
+                continue
+            except TimeoutError:
+                pass
+
+            try:
+                async with asyncio.timeout(TOKEN_REFRESH_IDLE_WAIT_SECONDS):
+                    await self._idle.wait()
+            except TimeoutError:
+                pass
+
+            _LOGGER.debug("Refreshing security token ahead of expiry")
+            try:
+                async with self._login_lock:
+                    await self._login()
+            except Exception as err:
+                _LOGGER.warning("Background token refresh failed: %s", err)
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_SECONDS)
+
+    def _seconds_until_token_refresh(self) -> float | None:
+        """Return the delay before the token should be renewed, if known."""
+        if (
+            not self.logged_in
+            or self.token_lifetime is None
+            or self._logged_in_at is None
+        ):
+            return None
+        refresh_at = self._logged_in_at + self.token_lifetime * TOKEN_REFRESH_MARGIN
+        return max(refresh_at - time.monotonic(), 0)
+
+    def _observe_token_success(self, generation: int, sent_at: float) -> None:
+        """Record that the current token was accepted by a request sent at sent_at.
+
+        A token still accepted when older than the learned lifetime widens the
+        estimate, so a lifetime learned too short recovers.
+        """
+        if generation != self._login_generation or self._logged_in_at is None:
+            return
+        if self._last_success_at is None or sent_at > self._last_success_at:
+            self._last_success_at = sent_at
+        age = sent_at - self._logged_in_at
+        if self.token_lifetime is not None and age > self.token_lifetime:
+            _LOGGER.debug("Security token still valid after %.0fs", age)
+            self.token_lifetime = age
+            self._token_changed.set()
+
+    def _observe_token_expiry(self) -> None:
+        """Learn the token lifetime from a request rejected as unauthorized.
+
+        The token was last known to be valid at the previous successful request,
+        so that age is used as a conservative estimate of its lifetime.
+        """
+        if self._logged_in_at is None or self._last_success_at is None:
+            return
+        observed = self._last_success_at - self._logged_in_at
+        if observed < MIN_TOKEN_LIFETIME_SECONDS:
+            return
+        if observed != self.token_lifetime:
+            _LOGGER.debug("Learned security token lifetime of %.0fs", observed)
+            self.token_lifetime = observed
+            self._token_changed.set()
+
+    async def _ensure_logged_in(self) -> None:
+        """Log in unless already logged in, sharing one login between callers."""
+        if self.logged_in:
+            return
+        async with self._login_lock:
+            if not self.logged_in:
+                await self._login()
 
     async def _login(self) -> None:
         """Log in to the API."""
         _LOGGER.info("Attempting login for %s", self.email)
-        self.gateway_device_id = await self._request_gateway_device_id()
-        _LOGGER.info("Connected to device %s", self.gateway_device_id)
+        # Requests keep using the previous token until both values are known,
+        # then switch to the new ones in a single step.
+        with profiler.measure(self.profiler, profiler.CATEGORY_LOGIN):
+            security_token, gateway_device_id = await self._request_gateway_device_id()
+        self.security_token = security_token
+        self.gateway_device_id = gateway_device_id
         self.logged_in = True
+        self._login_generation += 1
+        self._logged_in_at = time.monotonic()
+        self._last_success_at = None
+        self._token_changed.set()
+        _LOGGER.info("Connected to device %s", self.gateway_device_id)
 
-    async def _request_gateway_device_id(self) -> str:
-        """Request and return the gateway device ID."""
+    async def _request_gateway_device_id(self) -> tuple[str | None, str]:
+        """Request and return the security token and gateway device ID."""
         login_url = (
             f"{self.host}/userLogin?appId={APPID}&name={self.email}"
             f"&password={self.hashed_password}&timestamp={self._get_date()}"
         )
         result = await self._call_url_with_retry(login_url)
-        user_id = self._extract_user_details_from_login(result)
+        security_token, user_id = self._extract_user_details_from_login(result)
 
         device_id_url = (
-            f"{self.host}/getDeviceList?secToken={self.security_token}"
+            f"{self.host}/getDeviceList?secToken={security_token}"
             f"&userId={user_id}&timestamp={self._get_date()}"
         )
         result = await self._call_url_with_retry(device_id_url)
-        return self._extract_gateway_device_id(result)
+        return security_token, self._extract_gateway_device_id(result)
 
-    async def _request_devices(
-        self, parse_function: Any
-    ) -> gateway.Gateway | hotwater.HotWater:
+    async def _request_devices[_T](self, parse_function: Callable[[str], _T]) -> _T:
         """Request device data from the API."""
-        assert self.gateway_device_id is not None
-        url = (
-            f"{self.host}/setMultiDeviceAttributes2?secToken={self.security_token}"
-            f"&devId={self.gateway_device_id}&name1=B01&value1=5"
-            f"&timestamp={self._get_date()}"
-        )
-        await self._fetch_url_with_login_retry(url)
-
-        url = (
-            f"{self.host}/getDeviceAttributesWithValues?secToken={self.security_token}"
-            f"&devId={self.gateway_device_id}&deviceTypeId=1&timestamp={self._get_date()}"
-        )
-        response_content = await self._fetch_url_with_login_retry(url)
-        return parse_function(response_content)
-
-    async def _set_preset(self, device_id: str, state_name: str) -> None:
-        """Set thermostat preset mode."""
-        duration = str(1).zfill(2) if state_name in RUN_MODES_WITH_DURATION else ""
+        for fetch in range(1, POLL_MAX_FETCHES + 1):
+            try:
+                async with asyncio.timeout(POLL_MAX_WRITE_WAIT_SECONDS):
+                    await self._wait_for_writes()
+            except TimeoutError:
+                _LOGGER.debug("Polling while commands are still being sent")
+            generation = self._write_generation
+
+            refresh = codec.encode_commands([(codec.ATTR_REFRESH, codec.REFRESH_VALUE)])
+            await self._fetch_url_with_login_retry("setMultiDeviceAttributes2", refresh)
+            response_content = await self._fetch_url_with_login_retry(
+                "getDeviceAttributesWithValues", "&deviceTypeId=1"
+            )
+            if generation == self._write_generation:
+                break
+            if fetch < POLL_MAX_FETCHES:
+                _LOGGER.debug("Dropping device data requested before a command")
+            else:
+                _LOGGER.debug(
+                    "Keeping device data overlapped by commands %d times", fetch
+                )
 
-        payload = urllib.parse.quote(
-            f"!{device_id}{chr(int(RUN_MODES.index(state_name) + 35))}{duration}"
-        )
-        assert self.gateway_device_id is not None
-        url = (
-            f"{self.host}/setMultiDeviceAttributes2?secToken={self.security_token}"
-            f"&devId={self.gateway_device_id}&name1=B05&value1={payload}"
-            f"&timestamp={self._get_date()}"
-        )
-        result = await self._fetch_url_with_login_retry(url)
-        self._validate_operation_response(result)
+        with profiler.measure(self.profiler, profiler.CATEGORY_PARSE):
+            return parse_function(response_content)
 
-    async def _set_temperature(self, device_id: str, temperature: float) -> None:
-        """Set thermostat target temperature."""
-        payload = urllib.parse.quote(f"!{device_id}{chr(int(temperature * 2 + 32))}")
+    def _gateway_url(self, endpoint: str, params: str) -> str:
+        """Return the URL of a gateway request signed with the current token."""
         assert self.gateway_device_id is not None
-        url = (
-            f"{self.host}/setMultiDeviceAttributes2?secToken={self.security_token}"
-            f"&devId={self.gateway_device_id}&name1=B06&value1={payload}"
-            f"&timestamp={self._get_date()}"
+        return (
+            f"{self.host}/{endpoint}?secToken={self.security_token}"
+            f"&devId={self.gateway_device_id}{params}&timestamp={self._get_date()}"
         )
-        result = await self._fetch_url_with_login_retry(url)
-        self._validate_operation_response(result)
 
-    async def _set_hot_water(self, device_id: str, is_on: bool) -> None:
-        """Set hot water on or off."""
-        heating_state = "# " if is_on else "$ "
-        payload = urllib.parse.quote(f"!{device_id}{heating_state}")
-        assert self.gateway_device_id is not None
-        url = (
-            f"{self.host}/setMultiDeviceAttributes2?secToken={self.security_token}"
-            f"&devId={self.gateway_device_id}&name1=B05&value1={payload}"
-            f"&timestamp={self._get_date()}"
-        )
-        result = await self._fetch_url_with_login_retry(url)
-        self._validate_operation_response(result)
+    async def _fetch_url_with_login_retry(self, endpoint: str, params: str) -> str:
+        """Fetch a gateway endpoint with automatic login retry on failure.
 
-    async def _fetch_url_with_login_retry(self, url: str) -> str:
-        """Fetch a URL with automatic login retry on failure."""
+        The URL is rebuilt from the current token for every attempt, and a
+        failed attempt only logs in again if no other request has done so since
+        the attempt was sent.
+        """
         response_content = None
-        for attempt in range(3):
-            try:
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.get(url) as response,
-                ):
-                    if response.status == 200:
-                        response_content = await response.text()
-                        break
-
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            for attempt in range(3):
+                generation = self._login_generation
+                url = self._gateway_url(endpoint, params)
+                sent_at = time.monotonic()
+                status = None
+                try:
+                    with profiler.measure(self.profiler, profiler.CATEGORY_NETWORK):
+                        async with self._get(url) as response:
+                            status = response.status
+                            if status == 200:
+                                response_content = await self._read_response(response)
+                except aiohttp.ClientError as err:
                     _LOGGER.error(
-                        "Request to URL failed with status code %s on attempt %d,"
-                        " retrying",
-                        response.status,
+                        "Unexpected error making request to URL on attempt %d: %s",
                         attempt + 1,
+                        err,
                     )
-                    self.logged_in = False
-                    await self._login()
-            except aiohttp.ClientError as err:
+                    continue
+
+                if response_content is not None:
+                    self._observe_token_success(generation, sent_at)
+                    break
+
                 _LOGGER.error(
-                    "Unexpected error making request to URL on attempt %d: %s",
+                    "Request to URL failed with status code %s on attempt %d, retrying",
+                    status,
                     attempt + 1,
-                    err,
                 )
+                async with self._login_lock:
+                    if generation != self._login_generation:
+                        continue
+                    if status in AUTH_REJECTED_STATUSES:
+                        self._observe_token_expiry()
+                    self.logged_in = False
+                    await self._login()
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
 
         if response_content is None:
             raise TimeoutError("Failed to fetch URL after 3 attempts")
@@ -238,12 +402,9 @@ class JGClient:
         """Call a URL with retry logic."""
         for attempt in range(attempts):
             try:
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.get(url) as response,
-                ):
+                async with self._get(url) as response:
                     if response.status == 200:
-                        return await response.text()
+                        return await self._read_response(response)
 
                     _LOGGER.warning(
                         "Calling URL resulted in status code %s on attempt %d",
@@ -260,6 +421,61 @@ class JGClient:
 
         raise TimeoutError(f"Failed to call URL after {attempts} attempts")
 
+    @asynccontextmanager
+    async def _get(self, url: str) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Issue a GET request on the shared session or a short-lived one."""
+        if self._session is not None:
+            async with self._session.get(url) as response:
+                yield response
+            return
+        async with aiohttp.ClientSession() as session, session.get(url) as response:
+            yield response
+
+    async def _read_response(self, response: aiohttp.ClientResponse) -> str:
+        """Read a response body, aborting once it exceeds the size cap."""
+        if (
+            response.content_length is not None
+            and response.content_length > self.max_response_bytes
+        ):
+            raise ResponseTooLargeError(
+                f"Response of {response.content_length} bytes exceeds the"
+                f" {self.max_response_bytes} byte cap"
+            )
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_BYTES):
+            body += chunk
+            if len(body) > self.max_response_bytes:
+                raise ResponseTooLargeError(
+                    f"Response exceeds the {self.max_response_bytes} byte cap"
+                )
+        # get_encoding() cannot be used on a body read in chunks, it raises
+        # RuntimeError when the Content-Type has no charset.
+        return body.decode(response.charset or "utf-8", errors="replace")
+
+    def _log_processing_error(self, kind: str, err: Exception, response: str) -> None:
+        """Log a failure to process a response, truncated and rate limited."""
+        now = time.monotonic()
+        logged_at = self._error_logged_at.get(kind)
+        if logged_at is not None and now - logged_at < ERROR_LOG_INTERVAL_SECONDS:
+            self._suppressed_errors[kind] = self._suppressed_errors.get(kind, 0) + 1
+            _LOGGER.debug("Unexpected error processing %s results: %s", kind, err)
+            return
+
+        self._error_logged_at[kind] = now
+        suppressed = self._suppressed_errors.pop(kind, 0)
+        body = response[:ERROR_LOG_RESPONSE_CHARS]
+        if len(response) > ERROR_LOG_RESPONSE_CHARS:
+            body += f"... ({len(response) - ERROR_LOG_RESPONSE_CHARS} more characters)"
+        _LOGGER.error(
+            "Unexpected error processing %s results: %s (%d similar errors"
+            " suppressed)\n%s",
+            kind,
+            err,
+            suppressed,
+            body,
+        )
+
     def _extract_gateway_device_id(self, response: str) -> str:
         """Extract gateway device ID from login response."""
         tree = ET.fromstring(response)
@@ -268,122 +484,94 @@ class JGClient:
             raise ValueError("Could not extract device ID from response")
         return dev_id
 
-    def _extract_user_details_from_login(self, response: str) -> str:
-        """Extract user details from login response."""
+    def _extract_user_details_from_login(self, response: str) -> tuple[str | None, str]:
+        """Extract the security token and user ID from login response."""
         tree = ET.fromstring(response)
-        self.security_token = tree.findtext("securityToken")
         user_id = tree.findtext("userId")
         if user_id is None:
             raise ValueError("Could not extract user ID from response")
-        return user_id
+        return tree.findtext("securityToken"), user_id
 
     def _get_date(self) -> str:
         """Get current timestamp for API requests."""
         return str(datetime.now().timestamp()).replace(".", "")
 
+    def _extract_attribute_values(
+        self, response: str, match: str, wanted: frozenset[str]
+    ) -> list[tuple[str, str]]:
+        """Extract the wanted attributes as ``(key, value)`` pairs.
+
+        Top-level attributes are matched on their ``match`` child, ``name`` or
+        ``id``, and returned in document order, duplicates included.
+        """
+        values: list[tuple[str, str]] = []
+        for element in ET.fromstring(response).findall("./attrList"):
+            key = element.findtext(match)
+            if key in wanted:
+                value = element.findtext("value")
+                if value is not None:
+                    values.append((key, codec.unescape(value)))
+        return values
+
     def _extract_thermostats(self, response: str) -> gateway.Gateway:
         """Extract thermostat information from API response."""
-        tree = ET.fromstring(response)
+        values = self._extract_attribute_values(
+            response, "name", codec.THERMOSTAT_ATTRIBUTES
+        )
         try:
-            thermostat_display_node_names = ["S02", "S03"]
-            summary_node_names = ["001", "002", "003"]
-
-            items = []
-            for element in tree.findall("./attrList"):
-                name = element.findtext("name")
-                if name in thermostat_display_node_names or name in summary_node_names:
-                    value = element.findtext("value")
-                    if value is not None:
-                        value = (
-                            value.replace("&lt;", "<")
-                            .replace("&gt;", ">")
-                            .replace("&amp;", "&")
-                        )
-                        items.append(
-                            {"Id": element.findtext("id"), "Name": name, "Value": value}
-                        )
-
-            summaries = {}
-            for entry_value in (
-                x.get("Value") for x in items if x.get("Name") in summary_node_names
-            ):
-                for element in (
-                    entry_value[i : i + 8] for i in range(0, len(entry_value), 8)
-                ):
-                    if len(element) == 8:
-                        id_val = element[0:4]
-                        summaries[id_val] = element[4:]
+            summaries = codec.decode_summaries(
+                value for name, value in values if name in codec.SUMMARY_ATTRIBUTES
+            )
 
             thermostats = []
-            for entry_value in (
-                x.get("Value")
-                for x in items
-                if x.get("Name") in thermostat_display_node_names
-            ):
-                for element in (x for x in entry_value.split(",") if len(x) > 4):
-                    id_val = element[0:4]
+            for display_name, display_value in values:
+                if display_name not in codec.DISPLAY_ATTRIBUTES:
+                    continue
+                for id_val, name in codec.decode_names(display_value):
                     summary = summaries.get(id_val)
                     if summary is not None:
+                        status = codec.decode_status(summary)
                         thermostats.append(
                             thermostat.Thermostat(
                                 id_val,
-                                element[4:],
-                                ord(summary[1]) - 32 > 9,
-                                MODES[ord(summary[1]) - 32],
-                                (ord(summary[2]) - 32) * 0.5,
-                                (ord(summary[3]) - 32) * 0.5,
+                                name,
+                                status.on,
+                                status.state_name,
+                                status.temp_current,
+                                status.temp_set_point,
                             )
                         )
 
             return gateway.Gateway("JG-Gateway", "JG-Gateway", thermostats)
 
         except Exception as err:
-            _LOGGER.error(
-                "Unexpected error processing thermostat results: %s\n%s", err, response
-            )
+            self._log_processing_error("thermostat", err, response)
             raise
 
     def _extract_hot_water(self, response: str) -> hotwater.HotWater:
         """Extract hot water information from API response."""
-        tree = ET.fromstring(response)
+        values: dict[str, str] = {}
+        for attr_id, value in self._extract_attribute_values(
+            response, "id", codec.HOT_WATER_ATTRIBUTES
+        ):
+            values.setdefault(attr_id, value)
         try:
-            items = []
-            for element in tree.findall("./attrList"):
-                value = element.findtext("value")
-                if value is not None:
-                    value = (
-                        value.replace("&lt;", "<")
-                        .replace("&gt;", ">")
-                        .replace("&amp;", "&")
-                    )
-                    items.append({"Id": element.findtext("id"), "Value": value})
-
-            hot_water_on = False
-            hot_water_id_items = [item for item in items if item.get("Id") == "2272"]
-            if not hot_water_id_items:
+            if codec.HOT_WATER_ID_ATTRIBUTE_ID not in values:
                 raise ValueError("Could not find hot water ID in response")  # noqa: TRY301
 
-            hot_water_id = hot_water_id_items[0].get("Value", "").strip()
+            hot_water_id = values[codec.HOT_WATER_ID_ATTRIBUTE_ID].strip()
             hot_water_id = hot_water_id[1 : len(hot_water_id) - 1]
 
-            summary_items = [item for item in items if item.get("Id") == "2257"]
-            if not summary_items:
+            if codec.HOT_WATER_SUMMARY_ATTRIBUTE_ID not in values:
                 raise ValueError("Could not find hot water summary in response")  # noqa: TRY301
 
-            summary_value = summary_items[0].get("Value", "")
-            for element in [
-                summary_value[i : i + 8] for i in range(0, len(summary_value), 8)
-            ]:
-                if hot_water_id in element:
-                    hot_water_on = element[0 : len(hot_water_id) + 2].endswith("3")
-                    break
-
+            hot_water_on = codec.decode_hot_water(
+                values[codec.HOT_WATER_SUMMARY_ATTRIBUTE_ID], hot_water_id
+            )
             return hotwater.HotWater(hot_water_id, hot_water_on)
 
         except Exception as err:
-            _LOGGER.error(
-                "Unexpected error processing hot water results: %s\n%s", err, response
-            )
+            self._log_processing_error("hot water", err, response)
             raise
 
     def _validate_operation_response(self, response: str) -> None:
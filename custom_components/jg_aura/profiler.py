@@ -0,0 +1,152 @@
+"""On-demand profiling of JGAura coordinator cycles and commands.
+
+A Profiler is only attached to a client while a profile is being taken. Call
+sites use the module level ``cycle`` and ``measure`` helpers, which return a
+shared no-op context manager when no profiler is attached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import time
+from typing import Any
+
+CATEGORY_NETWORK = "network"
+CATEGORY_LOGIN = "login"
+CATEGORY_PARSE = "parse"
+CATEGORY_STATE_WRITE = "state_write"
+CATEGORY_OTHER = "other"
+
+_NULL_CONTEXT = nullcontext()
+
+_current_cycle: ContextVar[ProfiledCycle | None] = ContextVar(
+    "jg_aura_profiled_cycle", default=None
+)
+_measuring: ContextVar[bool] = ContextVar("jg_aura_profile_measuring", default=False)
+
+
+@dataclass
+class ProfiledCycle:
+    """Timings of one coordinator refresh or entity command."""
+
+    label: str
+    started: float
+    duration: float = 0.0
+    categories: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cycle as a JSON serialisable dict."""
+        categories = dict(self.categories)
+        categories[CATEGORY_OTHER] = max(self.duration - sum(categories.values()), 0)
+        return {
+            "label": self.label,
+            "started": datetime.fromtimestamp(self.started, UTC).isoformat(),
+            "duration": self.duration,
+            "categories": categories,
+        }
+
+
+class Profiler:
+    """Collect timings for the next ``cycles`` cycles.
+
+    Categories are exclusive: time spent inside a measured block is only
+    attributed to the outermost one, so network requests made during a login
+    count as login time.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize the profiler."""
+        self.cycles = cycles
+        self.started = time.time()
+        self.completed: list[ProfiledCycle] = []
+        self.done = asyncio.Event()
+
+    @property
+    def active(self) -> bool:
+        """Return whether more cycles are still to be recorded."""
+        return len(self.completed) < self.cycles
+
+    @asynccontextmanager
+    async def cycle(self, label: str) -> AsyncIterator[None]:
+        """Record the enclosed block as one cycle."""
+        if not self.active or _current_cycle.get() is not None:
+            yield
+            return
+
+        profiled = ProfiledCycle(label, time.time())
+        token = _current_cycle.set(profiled)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profiled.duration = time.perf_counter() - start
+            _current_cycle.reset(token)
+            if self.active:
+                self.completed.append(profiled)
+                if not self.active:
+                    self.done.set()
+
+    @contextmanager
+    def measure(self, category: str) -> Iterator[None]:
+        """Attribute the enclosed block to a category of the current cycle."""
+        profiled = _current_cycle.get()
+        if profiled is None or _measuring.get():
+            yield
+            return
+
+        token = _measuring.set(True)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _measuring.reset(token)
+            profiled.categories[category] = (
+                profiled.categories.get(category, 0.0) + time.perf_counter() - start
+            )
+
+    def report(self) -> dict[str, Any]:
+        """Return the collected timings with per-label totals."""
+        totals: dict[str, dict[str, Any]] = {}
+        cycles = [profiled.as_dict() for profiled in self.completed]
+        for profiled in cycles:
+            total = totals.setdefault(
+                profiled["label"], {"count": 0, "duration": 0.0, "categories": {}}
+            )
+            total["count"] += 1
+            total["duration"] += profiled["duration"]
+            for category, seconds in profiled["categories"].items():
+                total["categories"][category] = (
+                    total["categories"].get(category, 0.0) + seconds
+                )
+
+        return {
+            "started": datetime.fromtimestamp(self.started, UTC).isoformat(),
+            "requested_cycles": self.cycles,
+            "totals": totals,
+            "cycles": cycles,
+        }
+
+
+def cycle(profiler: Profiler | None, label: str) -> AbstractAsyncContextManager[Any]:
+    """Return a context manager recording a cycle, or a no-op one."""
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.cycle(label)
+
+
+def measure(profiler: Profiler | None, category: str) -> AbstractContextManager[Any]:
+    """Return a context manager measuring a category, or a no-op one."""
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.measure(category)
@@ -0,0 +1,124 @@
+"""Shared, reference-counted JGAura clients."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .jg_client import JGClient
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLIENT_REGISTRY: HassKey[ClientRegistry] = HassKey(f"{DOMAIN}_clients")
+
+# Released clients are kept this long so that a reload, or the setup that
+# follows config flow validation, reuses the login and the latest snapshot.
+CLIENT_LINGER_SECONDS = 60
+# Snapshots up to this old are reused for the first refresh of a coordinator.
+SNAPSHOT_REUSE_SECONDS = 30
+
+type _ClientKey = tuple[str, str, str]
+
+
+@dataclass
+class _RegisteredClient:
+    """A shared client and the state needed to tear it down."""
+
+    client: JGClient
+    token_refresh: asyncio.Task[None]
+    refs: int = 0
+    cancel_teardown: CALLBACK_TYPE | None = None
+
+
+class ClientRegistry:
+    """Share one client per host and account across config entries and flows.
+
+    Clients use Home Assistant's shared HTTP session and run the background
+    token refresh for as long as they are registered. Every client is torn
+    down when Home Assistant stops, including those still lingering.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self._clients: dict[_ClientKey, _RegisteredClient] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
+
+    async def async_acquire(self, host: str, email: str, password: str) -> JGClient:
+        """Return the shared client for an account, creating it if needed.
+
+        The client module is imported in the executor the first time, so the
+        event loop never blocks on it.
+        """
+        jg_client = await async_import_module(self._hass, f"{__package__}.jg_client")
+        key = (host, email, hashlib.sha256(password.encode()).hexdigest())
+        if (registered := self._clients.get(key)) is None:
+            client = jg_client.JGClient(
+                host, email, password, session=async_get_clientsession(self._hass)
+            )
+            registered = self._clients[key] = _RegisteredClient(
+                client,
+                self._hass.async_create_background_task(
+                    client.run_token_refresh(), f"{DOMAIN} token refresh"
+                ),
+            )
+        elif registered.cancel_teardown is not None:
+            registered.cancel_teardown()
+            registered.cancel_teardown = None
+
+        registered.refs += 1
+        return registered.client
+
+    @callback
+    def async_release(self, client: JGClient) -> None:
+        """Release a client, tearing it down once it has been unused a while."""
+        for key, registered in self._clients.items():
+            if registered.client is client:
+                break
+        else:
+            return
+
+        registered.refs -= 1
+        if registered.refs > 0:
+            return
+
+        @callback
+        def _teardown(_now: datetime) -> None:
+            _LOGGER.debug("Closing unused client for %s", client.email)
+            registered.token_refresh.cancel()
+            del self._clients[key]
+
+        registered.cancel_teardown = async_call_later(
+            self._hass, CLIENT_LINGER_SECONDS, _teardown
+        )
+
+    @callback
+    def _async_shutdown(self, _event: Event) -> None:
+        """Tear down every client, cancelling pending teardowns."""
+        for registered in self._clients.values():
+            if registered.cancel_teardown is not None:
+                registered.cancel_teardown()
+            registered.token_refresh.cancel()
+        self._clients.clear()
+
+
+@callback
+def async_get_client_registry(hass: HomeAssistant) -> ClientRegistry:
+    """Return the client registry shared by every JGAura config entry."""
+    if (registry := hass.data.get(DATA_CLIENT_REGISTRY)) is None:
+        registry = hass.data[DATA_CLIENT_REGISTRY] = ClientRegistry(hass)
+    return registry
@@ -0,0 +1,137 @@
+"""Staggered poll scheduling for JGAura coordinators."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import math
+import random
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey(f"{DOMAIN}_poll_scheduler")
+
+# Phases are offsets from the Unix epoch, so every coordinator shares one time
+# base whatever its interval. Candidate phases are this far apart.
+PHASE_RESOLUTION_SECONDS = 1.0
+
+POLL_JITTER_SECONDS = 2.0
+POLL_MIN_GAP_SECONDS = 5.0
+
+
+class PollScheduler:
+    """Spread the polls of every JGAura coordinator across their interval.
+
+    Each registered coordinator polls whenever the wall clock reaches its
+    phase modulo its interval, so entries set up in the same second still
+    interleave. The phase is picked to keep its polls furthest from those of
+    every coordinator already registered, whatever their intervals, and never
+    moves existing ones. A small random jitter is added to every poll without
+    changing the average rate.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._phases: dict[object, tuple[float, float]] = {}
+
+    @property
+    def registered(self) -> int:
+        """Return the number of registered coordinators."""
+        return len(self._phases)
+
+    def _pick_phase(self, interval_seconds: float) -> float:
+        """Return the phase whose polls are furthest from every registered one.
+
+        Polls every ``a`` seconds at phase ``p`` and every ``b`` seconds at
+        phase ``q`` come closest at the distance between ``p - q`` and the
+        nearest multiple of ``gcd(a, b)``.
+        """
+        interval_ms = round(interval_seconds * 1000)
+        step_ms = round(PHASE_RESOLUTION_SECONDS * 1000)
+        best_phase_ms, best_gap_ms = 0, -1
+        for phase_ms in range(0, interval_ms, step_ms):
+            gap_ms = interval_ms
+            for other_interval, other_phase in self._phases.values():
+                period_ms = math.gcd(interval_ms, round(other_interval * 1000))
+                offset_ms = (phase_ms - round(other_phase * 1000)) % period_ms
+                gap_ms = min(gap_ms, offset_ms, period_ms - offset_ms)
+            if gap_ms > best_gap_ms:
+                best_phase_ms, best_gap_ms = phase_ms, gap_ms
+        return best_phase_ms / 1000
+
+    @callback
+    def async_register(
+        self,
+        entry: ConfigEntry,
+        coordinator: DataUpdateCoordinator,
+        interval: timedelta,
+    ) -> CALLBACK_TYPE:
+        """Poll a coordinator on its own phase; return a callback to stop."""
+        interval_seconds = interval.total_seconds()
+        phase = self._pick_phase(interval_seconds)
+        registration = object()
+        self._phases[registration] = (interval_seconds, phase)
+        cancel_timer: CALLBACK_TYPE | None = None
+        active = True
+
+        _LOGGER.debug(
+            "Polling %s every %ss at phase %.1fs",
+            coordinator.name,
+            interval_seconds,
+            phase,
+        )
+
+        @callback
+        def _schedule() -> None:
+            nonlocal cancel_timer
+            if not active:
+                return
+            delay = (phase - time.time()) % interval_seconds
+            if delay < POLL_MIN_GAP_SECONDS:
+                delay += interval_seconds
+            cancel_timer = async_call_later(
+                self._hass, delay + random.uniform(0, POLL_JITTER_SECONDS), _fire
+            )
+
+        async def _poll() -> None:
+            try:
+                await coordinator.async_refresh()
+            finally:
+                _schedule()
+
+        @callback
+        def _fire(_now: datetime) -> None:
+            nonlocal cancel_timer
+            cancel_timer = None
+            entry.async_create_background_task(
+                self._hass, _poll(), f"{DOMAIN} poll {coordinator.name}"
+            )
+
+        @callback
+        def _unregister() -> None:
+            nonlocal active
+            active = False
+            if cancel_timer is not None:
+                cancel_timer()
+            self._phases.pop(registration, None)
+
+        _schedule()
+        return _unregister
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler shared by every JGAura config entry."""
+    if (scheduler := hass.data.get(DATA_POLL_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLL_SCHEDULER] = PollScheduler(hass)
+    return scheduler
@@ -0,0 +1,98 @@
+"""Services for JGAura integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+
+from . import profiler
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .jg_client import JGClient
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+DEFAULT_PROFILE_CYCLES = 5
+PROFILE_TIMEOUT_SECONDS = 3600
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the JGAura services."""
+
+    async def _async_profile(call: ServiceCall) -> None:
+        """Profile the next coordinator cycles of every loaded entry."""
+        clients = {
+            id(entry.runtime_data.client): entry.runtime_data.client
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        }
+        if not clients:
+            raise ServiceValidationError("No loaded JGAura entries to profile")
+        if any(client.profiler is not None for client in clients.values()):
+            raise ServiceValidationError("A JGAura profile is already running")
+
+        profile = profiler.Profiler(call.data[ATTR_CYCLES])
+        for client in clients.values():
+            client.profiler = profile
+
+        hass.async_create_background_task(
+            _async_collect_profile(hass, clients.values(), profile),
+            f"{DOMAIN} profile",
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
+
+
+async def _async_collect_profile(
+    hass: HomeAssistant, clients: Iterable[JGClient], profile: profiler.Profiler
+) -> None:
+    """Wait for a profile to finish, then detach it and save the report."""
+    try:
+        async with asyncio.timeout(PROFILE_TIMEOUT_SECONDS):
+            await profile.done.wait()
+    except TimeoutError:
+        _LOGGER.warning(
+            "Profile timed out after %d of %d cycles",
+            len(profile.completed),
+            profile.cycles,
+        )
+    finally:
+        for client in clients:
+            if client.profiler is profile:
+                client.profiler = None
+
+    path = hass.config.path(
+        f"{DOMAIN}_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    await hass.async_add_executor_job(_write_report, path, profile.report())
+    _LOGGER.info("Saved profile of %d cycles to %s", len(profile.completed), path)
+
+
+def _write_report(path: str, report: dict[str, Any]) -> None:
+    """Write a profile report to disk."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
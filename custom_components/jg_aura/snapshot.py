@@ -0,0 +1,140 @@
+"""Versioned snapshots of the whole gateway state."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .gateway import Gateway
+from .hotwater import HotWater
+
+type SnapshotSubscriber = Callable[[GatewaySnapshot, dict[str, Any]], None]
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class GatewaySnapshot:
+    """Immutable view of every zone and the hot water at one version."""
+
+    version: int
+    thermostats: Mapping[str, Mapping[str, Any]]
+    hot_water: Mapping[str, Any] | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a JSON serialisable dict."""
+        return {
+            "thermostats": {
+                zone_id: dict(zone) for zone_id, zone in self.thermostats.items()
+            },
+            "hot_water": None if self.hot_water is None else dict(self.hot_water),
+        }
+
+    def diff(self, previous: GatewaySnapshot) -> dict[str, Any]:
+        """Return the changes since a previous snapshot.
+
+        Only changed fields of changed zones are included, along with the ids of
+        removed zones and the hot water state when it changed.
+        """
+        changes: dict[str, Any] = {}
+        thermostats: dict[str, dict[str, Any]] = {}
+        for zone_id, zone in self.thermostats.items():
+            before = previous.thermostats.get(zone_id, _EMPTY)
+            fields = {
+                key: value for key, value in zone.items() if before.get(key) != value
+            }
+            if fields:
+                thermostats[zone_id] = fields
+        if thermostats:
+            changes["thermostats"] = thermostats
+
+        removed = [
+            zone_id
+            for zone_id in previous.thermostats
+            if zone_id not in self.thermostats
+        ]
+        if removed:
+            changes["removed"] = removed
+
+        if self.hot_water != previous.hot_water:
+            changes["hot_water"] = (
+                None if self.hot_water is None else dict(self.hot_water)
+            )
+        return changes
+
+
+class SnapshotStore:
+    """Hold the latest gateway snapshot and publish per-version diffs.
+
+    A new version is only created when the data actually changed, so
+    subscribers receive one message per change rather than one per poll.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self.snapshot = GatewaySnapshot(0, _EMPTY, None)
+        self._subscriptions: list[tuple[SnapshotSubscriber, CALLBACK_TYPE | None]] = []
+
+    @callback
+    def async_update_thermostats(self, gateway: Gateway) -> None:
+        """Publish new thermostat data."""
+        thermostats = MappingProxyType(
+            {
+                therm.id: MappingProxyType({**asdict(therm), "online": therm.online})
+                for therm in gateway.thermostats
+            }
+        )
+        self._async_publish(thermostats, self.snapshot.hot_water)
+
+    @callback
+    def async_update_hot_water(self, hot_water: HotWater | None) -> None:
+        """Publish new hot water data, or None once hot water is disabled."""
+        self._async_publish(
+            self.snapshot.thermostats,
+            None if hot_water is None else MappingProxyType(asdict(hot_water)),
+        )
+
+    @callback
+    def async_subscribe(
+        self, subscriber: SnapshotSubscriber, on_close: CALLBACK_TYPE | None = None
+    ) -> CALLBACK_TYPE:
+        """Call a subscriber with each new snapshot and its diff.
+
+        ``on_close`` is called if the store is closed while still subscribed.
+        """
+        subscription = (subscriber, on_close)
+        self._subscriptions.append(subscription)
+
+        @callback
+        def _unsubscribe() -> None:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+        return _unsubscribe
+
+    @callback
+    def async_close(self) -> None:
+        """End every subscription once the store is no longer updated."""
+        subscriptions, self._subscriptions = self._subscriptions, []
+        for _subscriber, on_close in subscriptions:
+            if on_close is not None:
+                on_close()
+
+    @callback
+    def _async_publish(
+        self,
+        thermostats: Mapping[str, Mapping[str, Any]],
+        hot_water: Mapping[str, Any] | None,
+    ) -> None:
+        """Store a new version if anything changed and notify subscribers."""
+        snapshot = GatewaySnapshot(self.snapshot.version + 1, thermostats, hot_water)
+        changes = snapshot.diff(self.snapshot)
+        if not changes:
+            return
+        self.snapshot = snapshot
+        for subscriber, _on_close in list(self._subscriptions):
+            subscriber(snapshot, changes)
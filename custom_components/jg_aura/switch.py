@@ -2,21 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import timedelta
 import logging
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import jg_client
-from .__init__ import JGAuraConfigEntry
+from . import jg_client, profiler
+from .coordinator import JGAuraConfigEntry, JGAuraHotWaterCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,32 +21,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform from a config entry."""
-    client = entry.runtime_data
-
-    async def async_update_data() -> jg_client.hotwater.HotWater:
-        """Update data from the API."""
-        try:
-            return await client.get_hot_water()
-        except Exception as err:
-            raise UpdateFailed(f"Failed to update hot water data: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="switch",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=60),
-        config_entry=entry,
-    )
-
-    await coordinator.async_config_entry_first_refresh()
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.hot_water
+    assert coordinator is not None
 
     hot_water_switch = HotWaterSwitch(coordinator, client, coordinator.data)
 
     def update_entities() -> None:
         """Update all entities when coordinator updates."""
-        hot_water_switch.set_state(coordinator.data.is_on)
-        hot_water_switch.async_write_ha_state()
+        with profiler.measure(client.profiler, profiler.CATEGORY_STATE_WRITE):
+            hot_water_switch.set_state(coordinator.data.is_on)
+            hot_water_switch.async_write_ha_state()
 
     coordinator.async_add_listener(update_entities)
 
@@ -67,7 +46,7 @@ class HotWaterSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: JGAuraHotWaterCoordinator,
         client: jg_client.JGClient,
         hot_water: jg_client.hotwater.HotWater,
     ) -> None:
@@ -89,19 +68,21 @@ class HotWaterSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: dict) -> None:
         """Turn on the hot water."""
         hot_water_id = self.coordinator.data.id
-        await self._client.set_hot_water(hot_water_id, True)
-        self._is_on = True
-        self.async_write_ha_state()
+        async with profiler.cycle(self._client.profiler, "set hot water"):
+            await self._client.set_hot_water(hot_water_id, True)
+            self._is_on = True
+            with profiler.measure(self._client.profiler, profiler.CATEGORY_STATE_WRITE):
+                self.async_write_ha_state()
 
-        await asyncio.sleep(jg_client.API_DELAY_SECONDS)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: dict) -> None:
         """Turn off the hot water."""
         hot_water_id = self.coordinator.data.id
-        await self._client.set_hot_water(hot_water_id, False)
-        self._is_on = False
-        self.async_write_ha_state()
+        async with profiler.cycle(self._client.profiler, "set hot water"):
+            await self._client.set_hot_water(hot_water_id, False)
+            self._is_on = False
+            with profiler.measure(self._client.profiler, profiler.CATEGORY_STATE_WRITE):
+                self.async_write_ha_state()
 
-        await asyncio.sleep(jg_client.API_DELAY_SECONDS)
         await self.coordinator.async_request_refresh()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .codec import OFFLINE_MODE
+
 
 @dataclass
 class Thermostat:
@@ -15,3 +17,8 @@ class Thermostat:
     state_name: str
     temp_current: float
     temp_set_point: float
+
+    @property
+    def online(self) -> bool:
+        """Return whether the thermostat is reachable by the gateway."""
+        return self.state_name != OFFLINE_MODE
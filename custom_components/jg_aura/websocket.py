@@ -0,0 +1,80 @@
+"""Websocket API for JGAura integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .snapshot import GatewaySnapshot
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the JGAura websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_snapshot)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/snapshot/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_snapshot(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the gateway snapshot once, then a compact diff per new version."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "JGAura entry not loaded"
+        )
+        return
+
+    store = entry.runtime_data.snapshots
+
+    @callback
+    def _forward_diff(snapshot: GatewaySnapshot, changes: dict[str, Any]) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"version": snapshot.version, "diff": changes}
+            )
+        )
+
+    @callback
+    def _end_subscription() -> None:
+        # The subscription already has a result, so it ends with a final
+        # event rather than an error that a client could not deliver.
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"version": store.snapshot.version, "closed": True}
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = store.async_subscribe(
+        _forward_diff, _end_subscription
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "version": store.snapshot.version,
+                "snapshot": store.snapshot.as_dict(),
+            },
+        )
+    )
@@ -0,0 +1,45 @@
+"""Micro-benchmark of parsing getDeviceAttributesWithValues responses.
+
+Run from the repository root with ``python -m tests.bench_parse``. Responses
+hold the sample attributes padded with unrelated ones up to each size.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from custom_components.jg_aura.jg_client import JGClient
+
+from .common import EMAIL, PASSWORD, SAMPLE_ATTRIBUTES, attributes_xml
+
+SIZES = (10, 50, 200)
+REPEATS = 5
+NUMBER = 2000
+
+
+def _response(size: int) -> str:
+    """Return a response with the sample attributes and unrelated padding."""
+    padding = [
+        (str(3000 + index), f"X{index:02}", "0" * 16)
+        for index in range(size - len(SAMPLE_ATTRIBUTES))
+    ]
+    return attributes_xml([*SAMPLE_ATTRIBUTES, *padding])
+
+
+def main() -> None:
+    """Print the best time per parse for each platform and response size."""
+    client = JGClient("http://127.0.0.1", EMAIL, PASSWORD)
+    for size in SIZES:
+        response = _response(size)
+        for name, parse in (
+            ("thermostats", client._extract_thermostats),
+            ("hot water", client._extract_hot_water),
+        ):
+            best = min(
+                timeit.repeat(lambda: parse(response), repeat=REPEATS, number=NUMBER)
+            )
+            print(f"{size:>4} attributes  {name:<12} {best / NUMBER * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Sample data and a local stand-in for the JGAura API."""
+
+from __future__ import annotations
+
+import asyncio
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+from custom_components.jg_aura import codec
+
+EMAIL = "user@example.com"
+PASSWORD = "secret"
+USER_ID = "42"
+GATEWAY_ID = "1000001"
+HOT_WATER_ID = "0A1B"
+
+
+def zone_block(
+    zone_id: str, mode_code: int, temp_current: float, temp_set_point: float
+) -> str:
+    """Return a summary block as the gateway reports it for one zone."""
+    return zone_id + "".join(
+        chr(value + codec.CHAR_OFFSET)
+        for value in (0, mode_code, int(temp_current * 2), int(temp_set_point * 2))
+    )
+
+
+def hot_water_block(hot_water_id: str, is_on: bool) -> str:
+    """Return a hot water summary block, its state digit is 3 when on."""
+    return f"{hot_water_id} {3 if is_on else 4}".ljust(codec.BLOCK_SIZE)
+
+
+# (id, name, value) of every attribute in a getDeviceAttributesWithValues
+# response: two zones in 001 and an offline zone in 002.
+SAMPLE_ATTRIBUTES: list[tuple[str, str, str]] = [
+    ("100", "B01", "5"),
+    ("101", "001", zone_block("0001", 4, 19.5, 21) + zone_block("0002", 1, 17, 18)),
+    ("102", "002", zone_block("0003", 0, 0, 0)),
+    ("103", "003", ""),
+    ("110", "S02", "0001Kitchen,0002Lounge"),
+    ("111", "S03", "0003Garage"),
+    ("2272", "H01", f"!{HOT_WATER_ID}!"),
+    (
+        "2257",
+        "H02",
+        hot_water_block("0F0F", False) + hot_water_block(HOT_WATER_ID, True),
+    ),
+]
+
+
+def attributes_xml(attributes: list[tuple[str, str, str]]) -> str:
+    """Return a getDeviceAttributesWithValues response.
+
+    Values are escaped twice, as the API does.
+    """
+    items = "".join(
+        f"<attrList><id>{attr_id}</id><name>{name}</name>"
+        f"<value>{escape(escape(value))}</value></attrList>"
+        for attr_id, name, value in attributes
+    )
+    return f"<response>{items}</response>"
+
+
+class StandInGateway:
+    """Local stand-in for the JGAura API.
+
+    Each login issues a new token and only the latest one is accepted.
+    ``statuses`` replaces the next responses with those HTTP status codes, and
+    ``pages`` with those non-XML pages served as a success. ``chunked`` sends
+    bodies without a Content-Length.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stand-in."""
+        self.attributes = list(SAMPLE_ATTRIBUTES)
+        self.charset: str | None = None
+        self.chunked = False
+        self.delay = 0.0
+        self.logins = 0
+        self.valid_token: str | None = None
+        self.statuses: list[int] = []
+        self.pages: list[str] = []
+        self.requests: list[str] = []
+        self.commands: list[list[tuple[str, str]]] = []
+        self.host = ""
+        self.app = web.Application()
+        self.app.router.add_get("/userLogin", self._user_login)
+        self.app.router.add_get("/getDeviceList", self._device_list)
+        self.app.router.add_get("/setMultiDeviceAttributes2", self._set_attributes)
+        self.app.router.add_get(
+            "/getDeviceAttributesWithValues", self._attributes_with_values
+        )
+
+    def expire_token(self) -> None:
+        """Reject the current token until the next login."""
+        self.valid_token = None
+
+    async def _respond(
+        self, request: web.Request, body: str, check_token: bool = True
+    ) -> web.Response:
+        """Return a response, or the next queued failure."""
+        self.requests.append(request.path)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.statuses:
+            return web.Response(status=self.statuses.pop(0))
+        if self.pages:
+            return web.Response(text=self.pages.pop(0), content_type="text/html")
+        if check_token and request.query.get("secToken") != self.valid_token:
+            return web.Response(status=401)
+        response = web.Response(
+            body=body.encode(self.charset or "utf-8"),
+            content_type="text/xml",
+            charset=self.charset,
+        )
+        if self.chunked:
+            response.enable_chunked_encoding()
+        return response
+
+    async def _user_login(self, request: web.Request) -> web.Response:
+        """Handle a login, issuing a new token."""
+        self.logins += 1
+        self.valid_token = f"token-{self.logins}"
+        return await self._respond(
+            request,
+            f"<response><userId>{USER_ID}</userId>"
+            f"<securityToken>{self.valid_token}</securityToken></response>",
+            check_token=False,
+        )
+
+    async def _device_list(self, request: web.Request) -> web.Response:
+        """Return the gateway device."""
+        return await self._respond(
+            request,
+            f"<response><devList><devId>{GATEWAY_ID}</devId></devList></response>",
+        )
+
+    async def _set_attributes(self, request: web.Request) -> web.Response:
+        """Record a batch of commands."""
+        response = await self._respond(
+            request, "<response><retCode>0</retCode></response>"
+        )
+        if response.status == 200:
+            self.commands.append(
+                [
+                    (request.query[f"name{index}"], request.query[f"value{index}"])
+                    for index in range(1, len(request.query))
+                    if f"name{index}" in request.query
+                ]
+            )
+        return response
+
+    async def _attributes_with_values(self, request: web.Request) -> web.Response:
+        """Return every attribute of the gateway."""
+        return await self._respond(request, attributes_xml(self.attributes))
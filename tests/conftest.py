@@ -0,0 +1,37 @@
+"""Fixtures for JGAura tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_EMAIL, CONF_HOST, CONF_PASSWORD
+
+from custom_components.jg_aura.const import DOMAIN
+
+from .common import EMAIL, PASSWORD, StandInGateway
+
+
+@pytest.fixture
+async def stand_in(socket_enabled: None) -> AsyncGenerator[StandInGateway]:
+    """Serve a stand-in JGAura API on localhost."""
+    gateway = StandInGateway()
+    server = TestServer(gateway.app)
+    await server.start_server()
+    gateway.host = f"http://{server.host}:{server.port}"
+    yield gateway
+    await server.close()
+
+
+@pytest.fixture
+def config_entry(stand_in: StandInGateway) -> MockConfigEntry:
+    """Return a config entry pointing at the stand-in API."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"JGAura ({EMAIL})",
+        unique_id=EMAIL,
+        data={CONF_HOST: stand_in.host, CONF_EMAIL: EMAIL, CONF_PASSWORD: PASSWORD},
+    )
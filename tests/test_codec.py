@@ -0,0 +1,161 @@
+"""Tests for the JGAura wire-protocol codec."""
+
+from __future__ import annotations
+
+import urllib.parse
+
+import pytest
+
+from custom_components.jg_aura import codec
+
+from .common import hot_water_block, zone_block
+
+ZONE_ID = "0001"
+# Every set point a single character can carry, in half degree steps.
+SET_POINTS = [half_degrees / 2 for half_degrees in range(256 - codec.CHAR_OFFSET)]
+
+
+def _command_payload(device_id: str, value: str) -> str:
+    """Return the payload of a command value, after the ``!<id>`` prefix."""
+    prefix = f"!{device_id}"
+    assert value.startswith(prefix)
+    return value[len(prefix) :]
+
+
+@pytest.mark.parametrize("temperature", SET_POINTS)
+def test_set_point_round_trip(temperature: float) -> None:
+    """Test every encodable set point decodes back from a status block."""
+    attribute, value = codec.encode_set_point(ZONE_ID, temperature)
+    payload = _command_payload(ZONE_ID, value)
+
+    assert attribute == codec.ATTR_SET_POINT
+    assert len(payload) == 1
+    status = codec.decode_status(f" !{payload}{payload}")
+    assert status.temp_current == temperature
+    assert status.temp_set_point == temperature
+
+
+@pytest.mark.parametrize("temperature", [-0.5, 112, 1000])
+def test_set_point_out_of_range(temperature: float) -> None:
+    """Test set points that do not fit in a character are rejected."""
+    with pytest.raises(ValueError):
+        codec.encode_set_point(ZONE_ID, temperature)
+
+
+@pytest.mark.parametrize("preset", codec.RUN_MODES)
+def test_preset_round_trip(preset: str) -> None:
+    """Test every preset decodes back to the same mode from a status block."""
+    attribute, value = codec.encode_preset(ZONE_ID, preset)
+    payload = _command_payload(ZONE_ID, value)
+
+    assert attribute == codec.ATTR_MODE
+    assert payload[1:] == ("01" if preset in codec.RUN_MODES_WITH_DURATION else "")
+    assert codec.decode_status(f" {payload[0]}((").state_name == preset
+
+
+def test_unknown_preset() -> None:
+    """Test an unknown preset is rejected."""
+    with pytest.raises(ValueError):
+        codec.encode_preset(ZONE_ID, "Boost")
+
+
+@pytest.mark.parametrize("code", range(len(codec.MODES)))
+def test_decode_status_modes(code: int) -> None:
+    """Test every mode code decodes to its mode and heating state."""
+    status = codec.decode_status(zone_block(ZONE_ID, code, 20.5, 21)[codec.ID_SIZE :])
+
+    assert status == codec.ZoneStatus(codec.MODES[code], code > 9, 20.5, 21)
+
+
+def test_decode_status_unknown_mode() -> None:
+    """Test a mode code beyond the table is rejected."""
+    with pytest.raises(ValueError):
+        codec.decode_status(
+            zone_block(ZONE_ID, len(codec.MODES), 20, 20)[codec.ID_SIZE :]
+        )
+
+
+@pytest.mark.parametrize("is_on", [True, False])
+def test_hot_water_round_trip(is_on: bool) -> None:
+    """Test hot water commands decode back from a summary buffer.
+
+    The gateway reports the commanded state code as a digit after the id.
+    """
+    attribute, value = codec.encode_hot_water(ZONE_ID, is_on)
+    payload = _command_payload(ZONE_ID, value)
+    summary = hot_water_block("0F0F", not is_on) + (
+        f"{ZONE_ID} {ord(payload[0]) - codec.CHAR_OFFSET}".ljust(codec.BLOCK_SIZE)
+    )
+
+    assert attribute == codec.ATTR_MODE
+    assert codec.decode_hot_water(summary, ZONE_ID) is is_on
+
+
+def test_decode_hot_water_missing_zone() -> None:
+    """Test hot water is off when its id is not in the summary."""
+    assert codec.decode_hot_water(hot_water_block("0F0F", True), ZONE_ID) is False
+
+
+@pytest.mark.parametrize(
+    ("buffer", "expected"),
+    [
+        ("", {}),
+        ("0001ABCD", {"0001": "ABCD"}),
+        ("0001ABCD0002EFGH", {"0001": "ABCD", "0002": "EFGH"}),
+        ("0001ABCD0002EF", {"0001": "ABCD"}),
+        ("0001ABC", {}),
+        ("0001ABCD0001EFGH", {"0001": "EFGH"}),
+    ],
+)
+def test_split_blocks(buffer: str, expected: dict[str, str]) -> None:
+    """Test whole blocks are split and trailing partial blocks dropped."""
+    assert codec.split_blocks(buffer) == expected
+
+
+def test_decode_summaries() -> None:
+    """Test later summary buffers override earlier ones, partial blocks ignored."""
+    summaries = codec.decode_summaries(
+        ["0001ABCD0002EF", "", "0002EFGH0003IJ", "0001WXYZ"]
+    )
+
+    assert summaries == {"0001": "WXYZ", "0002": "EFGH"}
+
+
+def test_decode_names() -> None:
+    """Test zone names are split by comma and short items skipped."""
+    assert codec.decode_names("0001Kitchen,0002,,0003Living room") == [
+        ("0001", "Kitchen"),
+        ("0003", "Living room"),
+    ]
+
+
+def test_unescape() -> None:
+    """Test the extra escaping of attribute values is undone once."""
+    assert codec.unescape("&lt;a&gt; &amp;lt;") == "<a> &lt;"
+
+
+def test_encode_commands() -> None:
+    """Test commands are numbered from one and their values quoted."""
+    commands = [
+        codec.encode_preset(ZONE_ID, "Away"),
+        codec.encode_set_point(ZONE_ID, 2),
+        codec.encode_hot_water("0A1B", False),
+    ]
+
+    query = codec.encode_commands(commands)
+
+    assert query == (
+        "&name1=B05&value1=%210001%2801"
+        "&name2=B06&value2=%210001%24"
+        "&name3=B05&value3=%210A1B%24%20"
+    )
+    assert urllib.parse.parse_qsl(query[1:]) == [
+        (key, item)
+        for index, (name, value) in enumerate(commands, start=1)
+        for key, item in ((f"name{index}", name), (f"value{index}", value))
+    ]
+
+
+def test_encode_no_commands() -> None:
+    """Test an empty batch encodes to no parameters."""
+    assert codec.encode_commands([]) == ""
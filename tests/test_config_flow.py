@@ -0,0 +1,93 @@
+"""Tests for the JGAura config and options flows."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_EMAIL, CONF_HOST, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+
+from custom_components.jg_aura.const import (
+    CONF_ENABLE_HOT_WATER,
+    CONF_REFRESH_RATE,
+    DEFAULT_REFRESH_RATE,
+    DOMAIN,
+)
+from custom_components.jg_aura.coordinator import climate_poll_interval
+
+from .common import EMAIL, PASSWORD, StandInGateway
+
+
+def _schema_default(result: dict, key: str) -> object:
+    """Return the default of a field in a form result."""
+    for marker in result["data_schema"].schema:
+        if marker == key:
+            return marker.default()
+    raise KeyError(key)
+
+
+async def test_user_step(
+    hass: HomeAssistant, enable_custom_integrations: None, stand_in: StandInGateway
+) -> None:
+    """Test the user step validates against the API and uses the defaults."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch("custom_components.jg_aura.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_HOST: stand_in.host, CONF_EMAIL: EMAIL, CONF_PASSWORD: PASSWORD},
+        )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    entry = result["result"]
+    assert entry.data[CONF_ENABLE_HOT_WATER] is True
+    assert entry.data[CONF_REFRESH_RATE] == DEFAULT_REFRESH_RATE
+
+
+@pytest.mark.parametrize("refresh_rate", [0, 4, 9])
+async def test_user_step_rejects_short_refresh_rate(
+    hass: HomeAssistant, enable_custom_integrations: None, refresh_rate: int
+) -> None:
+    """Test the user step applies the same refresh rate bounds as the options."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with pytest.raises(InvalidData):
+        await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_EMAIL: EMAIL,
+                CONF_PASSWORD: PASSWORD,
+                CONF_REFRESH_RATE: refresh_rate,
+            },
+        )
+
+
+async def test_options_default_matches_poll_interval(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the options form shows the interval used without a refresh rate."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_EMAIL: EMAIL, CONF_PASSWORD: PASSWORD}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    assert result["type"] is FlowResultType.FORM
+    assert (
+        _schema_default(result, CONF_REFRESH_RATE)
+        == climate_poll_interval(entry).total_seconds()
+    )
+
+    with pytest.raises(InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_REFRESH_RATE: 5}
+        )
@@ -0,0 +1,75 @@
+"""Tests for the JGAura coordinators."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.jg_aura.const import DEFAULT_REFRESH_RATE
+from custom_components.jg_aura.coordinator import (
+    OFFLINE_ZONE_FAST_POLLS,
+    OFFLINE_ZONE_POLL_INTERVAL,
+)
+
+from .common import SAMPLE_ATTRIBUTES, StandInGateway, zone_block
+
+
+def _garage(mode_code: int) -> list[tuple[str, str, str]]:
+    """Return the sample attributes with the garage zone in the given mode."""
+    return [
+        ("102", "002", zone_block("0003", mode_code, 12, 16))
+        if attr_id == "102"
+        else (attr_id, name, value)
+        for attr_id, name, value in SAMPLE_ATTRIBUTES
+    ]
+
+
+async def test_offline_zone_polls_sooner_for_a_while(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test a zone going offline speeds up a bounded number of polls."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.climate
+    configured = timedelta(seconds=DEFAULT_REFRESH_RATE)
+    assert coordinator.poll_interval == OFFLINE_ZONE_POLL_INTERVAL
+
+    stand_in.attributes = _garage(1)
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == configured
+
+    stand_in.attributes = _garage(0)
+    await coordinator.async_refresh()
+    for _ in range(OFFLINE_ZONE_FAST_POLLS):
+        assert coordinator.poll_interval == OFFLINE_ZONE_POLL_INTERVAL
+        await coordinator.async_refresh()
+
+    assert coordinator.poll_interval == configured
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_configured_interval_applies_while_offline(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test a new configured interval applies even while a zone is offline."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.climate
+    assert coordinator.poll_interval == OFFLINE_ZONE_POLL_INTERVAL
+
+    coordinator.async_set_poll_interval(timedelta(seconds=300))
+    await coordinator.async_refresh()
+
+    assert coordinator.poll_interval == timedelta(seconds=300)
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,116 @@
+"""Tests for setting up the JGAura integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import json
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from custom_components.jg_aura.const import CONF_ENABLE_HOT_WATER, CONF_REFRESH_RATE
+
+from .common import StandInGateway
+
+# Budgets are far above what the integration needs so that slow CI machines
+# pass, while an accidental blocking import or serial setup still fails.
+IMPORT_BUDGET_SECONDS = 0.25
+SETUP_BUDGET_SECONDS = 1.0
+
+# Imports every Home Assistant module the integration depends on first, so
+# that only the integration's own import time is measured.
+_IMPORT_SCRIPT = """
+import json, sys, time
+import voluptuous
+import homeassistant.components.websocket_api
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.update_coordinator
+import homeassistant.loader
+start = time.perf_counter()
+import custom_components.jg_aura
+import custom_components.jg_aura.config_flow
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in sys.modules if name.endswith(".jg_client"))
+print(json.dumps([elapsed, loaded]))
+"""
+
+
+def test_import_budget() -> None:
+    """Test importing the integration stays cheap and leaves jg_client unloaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    elapsed, loaded = json.loads(result.stdout)
+
+    assert loaded == []
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+async def test_setup_budget(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test setup against a local API logs in once and stays within budget."""
+    config_entry.add_to_hass(hass)
+
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert elapsed < SETUP_BUDGET_SECONDS
+    assert stand_in.logins == 1
+    assert len(hass.states.async_entity_ids("climate")) == 3
+    assert len(hass.states.async_entity_ids("switch")) == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_options_apply_without_reload(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test changed options apply to the running entry with no second login."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    runtime_data = config_entry.runtime_data
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_ENABLE_HOT_WATER: False, CONF_REFRESH_RATE: 120}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.hot_water").state == STATE_UNAVAILABLE
+    assert runtime_data.hot_water is None
+    assert runtime_data.climate.poll_interval == timedelta(seconds=120)
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_ENABLE_HOT_WATER: True, CONF_REFRESH_RATE: 120}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.hot_water").state == STATE_ON
+    assert runtime_data.hot_water is not None
+
+    assert config_entry.runtime_data is runtime_data
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert stand_in.logins == 1
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
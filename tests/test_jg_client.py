@@ -0,0 +1,478 @@
+"""Tests for the JGAura API client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import time
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from custom_components.jg_aura import codec, jg_client
+from custom_components.jg_aura.gateway import Gateway
+from custom_components.jg_aura.hotwater import HotWater
+from custom_components.jg_aura.jg_client import (
+    ERROR_LOG_INTERVAL_SECONDS,
+    ERROR_LOG_RESPONSE_CHARS,
+    TOKEN_REFRESH_MARGIN,
+    JGClient,
+    ResponseTooLargeError,
+)
+from custom_components.jg_aura.thermostat import Thermostat
+
+from .common import (
+    EMAIL,
+    HOT_WATER_ID,
+    PASSWORD,
+    SAMPLE_ATTRIBUTES,
+    attributes_xml,
+    hot_water_block,
+    StandInGateway,
+    zone_block,
+)
+
+
+@pytest.fixture
+def client() -> JGClient:
+    """Return a client that is not connected to any API."""
+    return JGClient("http://127.0.0.1", EMAIL, PASSWORD)
+
+
+@pytest.fixture
+def api_client(stand_in: StandInGateway) -> JGClient:
+    """Return a client connected to the stand-in API."""
+    return JGClient(stand_in.host, EMAIL, PASSWORD)
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 2) -> None:
+    """Wait until a condition holds, failing after the timeout."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@contextlib.asynccontextmanager
+async def _token_refresh(client: JGClient):
+    """Run the background token refresh of a client, cancelling it on exit."""
+    task = asyncio.create_task(client.run_token_refresh())
+    try:
+        yield task
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def test_extract_thermostats(client: JGClient) -> None:
+    """Test every named zone with a summary block is extracted."""
+    result = client._extract_thermostats(attributes_xml(SAMPLE_ATTRIBUTES))
+
+    assert result == Gateway(
+        "JG-Gateway",
+        "JG-Gateway",
+        [
+            Thermostat("0001", "Kitchen", False, "High", 19.5, 21),
+            Thermostat("0002", "Lounge", False, "Auto", 17, 18),
+            Thermostat("0003", "Garage", False, "OFFLINE", 0, 0),
+        ],
+    )
+    assert [therm.online for therm in result.thermostats] == [True, True, False]
+
+
+def test_extract_thermostats_escaped_values(client: JGClient) -> None:
+    """Test characters the API escapes decode to their temperatures."""
+    response = attributes_xml(
+        [
+            (
+                "101",
+                "001",
+                zone_block("0001", 10, 15, 14) + zone_block("0002", 4, 3, 3),
+            ),
+            ("110", "S02", "0001Kitchen,0002Hall & stairs"),
+        ]
+    )
+
+    assert client._extract_thermostats(response).thermostats == [
+        Thermostat("0001", "Kitchen", True, "ON", 15, 14),
+        Thermostat("0002", "Hall & stairs", False, "High", 3, 3),
+    ]
+
+
+def test_extract_thermostats_duplicate_attributes(client: JGClient) -> None:
+    """Test duplicate attributes are read in document order."""
+    response = attributes_xml(
+        [
+            ("111", "S03", "0002Lounge"),
+            (
+                "101",
+                "001",
+                zone_block("0001", 4, 19, 20) + zone_block("0002", 4, 19, 20),
+            ),
+            ("110", "S02", "0001Kitchen"),
+            ("102", "001", zone_block("0001", 5, 18, 22)),
+            ("103", "S02", "0003Garage"),
+        ]
+    )
+
+    assert client._extract_thermostats(response).thermostats == [
+        Thermostat("0002", "Lounge", False, "High", 19, 20),
+        Thermostat("0001", "Kitchen", False, "Medium", 18, 22),
+    ]
+
+
+def test_extract_thermostats_matches_names(client: JGClient) -> None:
+    """Test thermostat attributes are matched by name, not id."""
+    response = attributes_xml(
+        [
+            ("001", "X01", zone_block("0001", 4, 19, 20)),
+            ("S02", "X02", "0001Kitchen"),
+            ("101", "001", zone_block("0002", 4, 19, 20)),
+            ("110", "S02", "0002Lounge"),
+        ]
+    )
+
+    assert client._extract_thermostats(response).thermostats == [
+        Thermostat("0002", "Lounge", False, "High", 19, 20)
+    ]
+
+
+def test_extract_thermostats_top_level_only(client: JGClient) -> None:
+    """Test attributes nested below other elements are ignored."""
+    response = attributes_xml(
+        [
+            ("101", "001", zone_block("0001", 4, 19, 20)),
+            ("110", "S02", "0001Kitchen"),
+        ]
+    ).replace(
+        "</response>",
+        "<group><attrList><id>111</id><name>S02</name>"
+        "<value>0001Hidden</value></attrList></group></response>",
+    )
+
+    assert client._extract_thermostats(response).thermostats == [
+        Thermostat("0001", "Kitchen", False, "High", 19, 20)
+    ]
+
+
+def test_extract_thermostats_invalid_mode(client: JGClient) -> None:
+    """Test an unknown mode code fails the whole response."""
+    response = attributes_xml(
+        [
+            ("101", "001", zone_block("0001", 40, 19, 20)),
+            ("110", "S02", "0001Kitchen"),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        client._extract_thermostats(response)
+
+
+def test_extract_hot_water(client: JGClient) -> None:
+    """Test the hot water id and state are extracted."""
+    result = client._extract_hot_water(attributes_xml(SAMPLE_ATTRIBUTES))
+
+    assert result == HotWater(HOT_WATER_ID, True)
+
+
+def test_extract_hot_water_duplicate_attributes(client: JGClient) -> None:
+    """Test the first occurrence of each hot water attribute is used."""
+    response = attributes_xml(
+        [
+            ("2272", "H01", f"!{HOT_WATER_ID}!"),
+            ("2257", "H02", hot_water_block(HOT_WATER_ID, False)),
+            ("2272", "H01", "!0F0F!"),
+            ("2257", "H02", hot_water_block(HOT_WATER_ID, True)),
+        ]
+    )
+
+    assert client._extract_hot_water(response) == HotWater(HOT_WATER_ID, False)
+
+
+def test_extract_hot_water_matches_ids(client: JGClient) -> None:
+    """Test hot water attributes are matched by id, not name."""
+    response = attributes_xml(
+        [
+            ("300", "2272", "!0F0F!"),
+            ("2272", "H01", f"!{HOT_WATER_ID}!"),
+            ("2257", "H02", hot_water_block(HOT_WATER_ID, True)),
+        ]
+    )
+
+    assert client._extract_hot_water(response) == HotWater(HOT_WATER_ID, True)
+
+
+@pytest.mark.parametrize(
+    ("missing_id", "message"),
+    [("2272", "hot water ID"), ("2257", "hot water summary")],
+)
+def test_extract_hot_water_missing_attribute(
+    client: JGClient, missing_id: str, message: str
+) -> None:
+    """Test a missing hot water attribute fails with a clear error."""
+    response = attributes_xml(
+        [attribute for attribute in SAMPLE_ATTRIBUTES if attribute[0] != missing_id]
+    )
+
+    with pytest.raises(ValueError, match=message):
+        client._extract_hot_water(response)
+
+
+async def test_expired_token_recovers_in_one_call(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test a request rejected for an expired token retries with the new one."""
+    await api_client.get_hot_water()
+    stand_in.expire_token()
+
+    assert await api_client.get_hot_water() == HotWater(HOT_WATER_ID, True)
+    assert stand_in.logins == 2
+
+
+async def test_concurrent_rejections_log_in_once(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test requests rejected together share a single login."""
+    await api_client.get_hot_water()
+    stand_in.expire_token()
+    stand_in.delay = 0.05
+
+    await asyncio.gather(*(api_client.get_hot_water() for _ in range(5)))
+
+    assert stand_in.logins == 2
+
+
+async def test_token_lifetime_learned_from_rejection(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test an unauthorized response teaches the token lifetime."""
+    await api_client.get_hot_water()
+    api_client._logged_in_at -= 600
+    await api_client.get_hot_water()
+    stand_in.expire_token()
+
+    await api_client.get_hot_water()
+
+    assert api_client.token_lifetime is not None
+    assert 600 <= api_client.token_lifetime < 610
+
+
+@pytest.mark.parametrize("status", [500, 502])
+async def test_server_error_does_not_learn_lifetime(
+    stand_in: StandInGateway, api_client: JGClient, status: int
+) -> None:
+    """Test a failure that is not an auth rejection leaves the lifetime unknown."""
+    await api_client.get_hot_water()
+    api_client._logged_in_at -= 600
+    await api_client.get_hot_water()
+    stand_in.statuses = [status]
+
+    await api_client.get_hot_water()
+
+    assert api_client.token_lifetime is None
+
+
+async def test_token_lifetime_widens(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test a token accepted past the learned lifetime widens the estimate."""
+    await api_client.get_hot_water()
+    api_client.token_lifetime = 100
+    api_client._logged_in_at -= 300
+
+    await api_client.get_hot_water()
+
+    assert api_client.token_lifetime is not None
+    assert api_client.token_lifetime >= 300
+    assert stand_in.logins == 1
+
+
+async def test_token_refresh_at_margin(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test the token is renewed once the margin of its lifetime has passed."""
+    await api_client.get_hot_water()
+    logged_in_at = api_client._logged_in_at
+    assert logged_in_at is not None
+    api_client.token_lifetime = 0.5
+
+    async with _token_refresh(api_client):
+        await _wait_for(lambda: api_client._login_generation == 2)
+
+    assert stand_in.logins == 2
+    assert api_client._logged_in_at is not None
+    age = api_client._logged_in_at - logged_in_at
+    assert 0.5 * TOKEN_REFRESH_MARGIN <= age < 0.5
+    assert api_client.security_token == stand_in.valid_token
+
+
+async def test_token_refresh_waits_for_idle(
+    stand_in: StandInGateway, api_client: JGClient
+) -> None:
+    """Test the token is not renewed while a request is in flight."""
+    await api_client.get_hot_water()
+    api_client.token_lifetime = 0.1
+    api_client._idle.clear()
+
+    async with _token_refresh(api_client):
+        await asyncio.sleep(0.3)
+        assert stand_in.logins == 1
+        api_client._idle.set()
+        await _wait_for(lambda: stand_in.logins == 2)
+
+
+async def test_token_refresh_survives_failed_login(
+    stand_in: StandInGateway,
+    api_client: JGClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a login answered with a page that is not XML is retried."""
+    monkeypatch.setattr(jg_client, "TOKEN_REFRESH_RETRY_SECONDS", 0.05)
+    await api_client.get_hot_water()
+    api_client.token_lifetime = 0.1
+    stand_in.pages = ["<html>maintenance"]
+
+    async with _token_refresh(api_client) as task:
+        await _wait_for(lambda: stand_in.logins >= 3)
+        assert not task.done()
+
+    assert await api_client.get_hot_water() == HotWater(HOT_WATER_ID, True)
+
+
+async def test_command_during_poll_refetches(
+    stand_in: StandInGateway, api_client: JGClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a poll overlapped by a command drops its result and fetches again."""
+    monkeypatch.setattr(jg_client, "API_DELAY_SECONDS", 0.05)
+    await api_client.get_thermostats()
+    stand_in.delay = 0.1
+
+    poll = asyncio.create_task(api_client.get_thermostats())
+    await _wait_for(
+        lambda: stand_in.requests.count("/getDeviceAttributesWithValues") == 2
+    )
+    await api_client.send_commands([codec.encode_set_point("0001", 22)])
+    stand_in.attributes = [
+        ("101", "001", zone_block("0001", 4, 19.5, 22)),
+        ("110", "S02", "0001Kitchen"),
+    ]
+
+    gateway = await poll
+    assert gateway.thermostats == [
+        Thermostat("0001", "Kitchen", False, "High", 19.5, 22)
+    ]
+    assert stand_in.requests.count("/getDeviceAttributesWithValues") == 3
+
+
+async def test_poll_waits_after_command(
+    stand_in: StandInGateway, api_client: JGClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a poll waits for the gateway to apply the last command."""
+    monkeypatch.setattr(jg_client, "API_DELAY_SECONDS", 0.3)
+    await api_client.get_thermostats()
+    await api_client.send_commands([codec.encode_set_point("0001", 22)])
+
+    began = time.monotonic()
+    await api_client.get_thermostats()
+
+    assert time.monotonic() - began >= 0.25
+
+
+async def test_failed_command_releases_polls(
+    stand_in: StandInGateway, api_client: JGClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test polls carry on after a command fails."""
+    monkeypatch.setattr(jg_client, "API_DELAY_SECONDS", 0.05)
+    await api_client.get_thermostats()
+    stand_in.pages = ["<html>maintenance"]
+
+    with pytest.raises(ParseError):
+        await api_client.send_commands([codec.encode_set_point("0001", 22)])
+
+    assert api_client._writes_idle.is_set()
+    async with asyncio.timeout(1):
+        await api_client.get_thermostats()
+
+
+async def test_steady_commands_do_not_starve_polls(
+    stand_in: StandInGateway, api_client: JGClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a poll returns data while commands never stop."""
+    monkeypatch.setattr(jg_client, "API_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(jg_client, "POLL_MAX_FETCHES", 2)
+    monkeypatch.setattr(jg_client, "POLL_MAX_WRITE_WAIT_SECONDS", 0.2)
+    await api_client.get_thermostats()
+    stand_in.delay = 0.02
+
+    async def _send_commands() -> None:
+        while True:
+            await api_client.send_commands([codec.encode_set_point("0001", 22)])
+
+    commands = asyncio.create_task(_send_commands())
+    try:
+        async with asyncio.timeout(2):
+            await api_client.get_thermostats()
+    finally:
+        commands.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await commands
+
+    assert stand_in.requests.count("/getDeviceAttributesWithValues") == 3
+
+
+@pytest.mark.parametrize(
+    ("chunked", "message"),
+    [(False, "Response of [0-9]+ bytes exceeds"), (True, "Response exceeds")],
+)
+async def test_response_size_cap(
+    stand_in: StandInGateway, chunked: bool, message: str
+) -> None:
+    """Test responses over the cap are rejected, before reading when sized."""
+    stand_in.chunked = chunked
+    client = JGClient(stand_in.host, EMAIL, PASSWORD, max_response_bytes=300)
+
+    with pytest.raises(ResponseTooLargeError, match=message):
+        await client.get_thermostats()
+
+
+def test_processing_error_log_truncated_and_rate_limited(
+    client: JGClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test response bodies in error logs are truncated and logged once a while."""
+    response = attributes_xml([("2272", "H01", "!0A1B!"), ("9999", "X99", "x" * 600)])
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            client._extract_hot_water(response)
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == 1
+    assert "(0 similar errors suppressed)" in errors[0].getMessage()
+    assert (
+        errors[0]
+        .getMessage()
+        .endswith(f"... ({len(response) - ERROR_LOG_RESPONSE_CHARS} more characters)")
+    )
+
+    client._error_logged_at["hot water"] -= ERROR_LOG_INTERVAL_SECONDS
+    with pytest.raises(ValueError):
+        client._extract_hot_water(response)
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == 2
+    assert "(2 similar errors suppressed)" in errors[1].getMessage()
+
+
+@pytest.mark.parametrize("charset", [None, "utf-8", "iso-8859-1"])
+async def test_response_charset(
+    stand_in: StandInGateway, api_client: JGClient, charset: str | None
+) -> None:
+    """Test responses decode with or without a charset in the Content-Type."""
+    stand_in.charset = charset
+    stand_in.attributes = [
+        ("101", "001", zone_block("0001", 4, 19, 20)),
+        ("110", "S02", "0001Küche"),
+    ]
+
+    gateway = await api_client.get_thermostats()
+
+    assert [therm.name for therm in gateway.thermostats] == ["Küche"]
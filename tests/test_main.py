@@ -0,0 +1,94 @@
+"""Tests for the JGAura command line interface."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.jg_aura import codec
+from custom_components.jg_aura.__main__ import _parse_args, _set, _watch
+from custom_components.jg_aura.gateway import Gateway
+from custom_components.jg_aura.jg_client import DEFAULT_MAX_RESPONSE_BYTES, JGClient
+
+from .common import EMAIL, HOT_WATER_ID, PASSWORD, StandInGateway
+
+BASE_ARGS = ["--email", EMAIL, "--password", PASSWORD]
+
+
+@pytest.mark.parametrize(
+    "mode_args",
+    [
+        ["bench", "-n", "0"],
+        ["bench", "--requests", "-1"],
+        ["bench", "-c", "0"],
+        ["watch", "--count", "0"],
+        ["set", "commands.jsonl", "--batch-size", "0"],
+        ["--max-response-bytes", "0", "watch"],
+    ],
+)
+def test_counts_must_be_positive(mode_args: list[str]) -> None:
+    """Test counts below one are rejected before anything runs."""
+    with pytest.raises(SystemExit):
+        _parse_args([*BASE_ARGS, *mode_args])
+
+
+def test_max_response_bytes() -> None:
+    """Test the response size cap can be set from the command line."""
+    assert _parse_args([*BASE_ARGS, "watch"]).max_response_bytes == (
+        DEFAULT_MAX_RESPONSE_BYTES
+    )
+    args = _parse_args([*BASE_ARGS, "--max-response-bytes", "4096", "watch"])
+    assert args.max_response_bytes == 4096
+
+
+async def test_watch_continues_after_failure(capsys: pytest.CaptureFixture) -> None:
+    """Test a failed cycle is reported as a record and watching continues."""
+    args = _parse_args(
+        [*BASE_ARGS, "watch", "--interval", "0", "--count", "2", "--no-hot-water"]
+    )
+    client = JGClient("http://127.0.0.1", EMAIL, PASSWORD)
+
+    with patch.object(
+        client,
+        "get_thermostats",
+        side_effect=[
+            TimeoutError("Failed to fetch URL after 3 attempts"),
+            Gateway("JG-Gateway", "JG-Gateway", []),
+        ],
+    ):
+        assert await _watch(client, args) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["type"] for record in records] == ["error", "thermostats"]
+    assert records[0]["error"] == "TimeoutError: Failed to fetch URL after 3 attempts"
+
+
+async def test_set_skips_offline_zones(
+    stand_in: StandInGateway, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """Test commands to an offline zone are reported and only the rest are sent."""
+    commands = tmp_path / "commands.jsonl"
+    commands.write_text(
+        '{"device": "0001", "temperature": 21}\n'
+        '{"device": "0003", "preset": "Away"}\n'
+        f'{{"device": "{HOT_WATER_ID}", "hot_water": true}}\n',
+        encoding="utf-8",
+    )
+    args = _parse_args([*BASE_ARGS, "set", str(commands)])
+    client = JGClient(stand_in.host, EMAIL, PASSWORD)
+
+    assert await _set(client, args) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["type"] for record in records] == ["error", "set"]
+    assert records[0]["error"] == "Zone 0003 is offline"
+    assert records[1]["commands"] == 2
+    assert stand_in.commands[1:] == [
+        [
+            codec.encode_set_point("0001", 21),
+            codec.encode_hot_water(HOT_WATER_ID, True),
+        ]
+    ]
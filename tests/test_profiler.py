@@ -0,0 +1,98 @@
+"""Tests for the JGAura profiler."""
+
+from __future__ import annotations
+
+import time
+
+from custom_components.jg_aura import profiler
+from custom_components.jg_aura.profiler import (
+    CATEGORY_LOGIN,
+    CATEGORY_NETWORK,
+    CATEGORY_OTHER,
+    CATEGORY_PARSE,
+    Profiler,
+)
+
+
+async def test_records_requested_cycles() -> None:
+    """Test only the requested number of cycles is recorded."""
+    profile = Profiler(2)
+
+    async with profile.cycle("climate refresh"):
+        pass
+    assert profile.active
+    assert not profile.done.is_set()
+
+    async with profile.cycle("switch refresh"):
+        pass
+    assert not profile.active
+    assert profile.done.is_set()
+
+    async with profile.cycle("climate refresh"):
+        pass
+    assert [cycle.label for cycle in profile.completed] == [
+        "climate refresh",
+        "switch refresh",
+    ]
+
+
+async def test_nested_cycle_is_part_of_outer() -> None:
+    """Test a cycle started inside another one is not recorded on its own."""
+    profile = Profiler(2)
+
+    async with profile.cycle("climate refresh"), profile.cycle("command"):
+        pass
+
+    assert [cycle.label for cycle in profile.completed] == ["climate refresh"]
+
+
+async def test_categories_are_exclusive() -> None:
+    """Test time in nested blocks only counts for the outermost category."""
+    profile = Profiler(1)
+
+    async with profile.cycle("climate refresh"):
+        with profile.measure(CATEGORY_LOGIN):
+            with profile.measure(CATEGORY_NETWORK):
+                time.sleep(0.01)
+        with profile.measure(CATEGORY_PARSE):
+            pass
+
+    categories = profile.completed[0].as_dict()["categories"]
+    assert set(categories) == {CATEGORY_LOGIN, CATEGORY_PARSE, CATEGORY_OTHER}
+    assert categories[CATEGORY_LOGIN] >= 0.01
+    assert categories[CATEGORY_OTHER] >= 0
+
+
+async def test_measure_outside_cycle() -> None:
+    """Test measuring outside a cycle records nothing."""
+    profile = Profiler(1)
+
+    with profile.measure(CATEGORY_NETWORK):
+        pass
+
+    assert profile.completed == []
+    assert profiler.cycle(None, "climate refresh") is profiler.measure(
+        None, CATEGORY_NETWORK
+    )
+
+
+async def test_report_totals() -> None:
+    """Test the report sums the cycles of each label."""
+    profile = Profiler(3)
+    for label in ("climate refresh", "climate refresh", "switch refresh"):
+        async with profile.cycle(label):
+            with profile.measure(CATEGORY_NETWORK):
+                pass
+
+    report = profile.report()
+
+    assert report["requested_cycles"] == 3
+    assert len(report["cycles"]) == 3
+    assert {label: total["count"] for label, total in report["totals"].items()} == {
+        "climate refresh": 2,
+        "switch refresh": 1,
+    }
+    assert set(report["totals"]["climate refresh"]["categories"]) == {
+        CATEGORY_NETWORK,
+        CATEGORY_OTHER,
+    }
@@ -0,0 +1,105 @@
+"""Tests for the shared JGAura client registry."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+from custom_components.jg_aura.registry import (
+    CLIENT_LINGER_SECONDS,
+    async_get_client_registry,
+)
+
+from .common import EMAIL, PASSWORD
+
+HOST = "http://127.0.0.1"
+
+
+async def test_shared_until_last_release(hass: HomeAssistant) -> None:
+    """Test acquiring the same account twice shares one reference-counted client."""
+    registry = async_get_client_registry(hass)
+    first = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    second = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    (registered,) = registry._clients.values()
+
+    assert first is second
+    assert registered.refs == 2
+
+    registry.async_release(first)
+    assert registered.refs == 1
+    assert registered.cancel_teardown is None
+
+    registry.async_release(second)
+    assert registered.refs == 0
+    assert registered.cancel_teardown is not None
+
+
+async def test_reused_while_lingering(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a client released and acquired again within the linger is reused."""
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    registry.async_release(client)
+
+    freezer.tick(timedelta(seconds=CLIENT_LINGER_SECONDS - 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert await registry.async_acquire(HOST, EMAIL, PASSWORD) is client
+
+    (registered,) = registry._clients.values()
+    assert registered.cancel_teardown is None
+    registry.async_release(client)
+
+
+async def test_teardown_after_linger(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an unused client is torn down once the linger has passed."""
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    (registered,) = registry._clients.values()
+    registry.async_release(client)
+
+    freezer.tick(timedelta(seconds=CLIENT_LINGER_SECONDS + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert registered.token_refresh.cancelled()
+    assert registry._clients == {}
+    new_client = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    assert new_client is not client
+    registry.async_release(new_client)
+
+
+async def test_new_password_new_client(hass: HomeAssistant) -> None:
+    """Test a changed password maps to a separate client."""
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    other = await registry.async_acquire(HOST, EMAIL, "changed")
+
+    assert other is not client
+    assert other.hashed_password != client.hashed_password
+    assert len(registry._clients) == 2
+
+    registry.async_release(client)
+    registry.async_release(other)
+
+
+async def test_stop_tears_down_lingering_clients(hass: HomeAssistant) -> None:
+    """Test stopping Home Assistant cancels pending teardowns and refreshes."""
+    registry = async_get_client_registry(hass)
+    client = await registry.async_acquire(HOST, EMAIL, PASSWORD)
+    (registered,) = registry._clients.values()
+    registry.async_release(client)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert registered.token_refresh.cancelled()
+    assert registry._clients == {}
@@ -0,0 +1,108 @@
+"""Tests for the JGAura poll scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import math
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.jg_aura.const import DOMAIN
+from custom_components.jg_aura.scheduler import POLL_JITTER_SECONDS, PollScheduler
+
+
+@pytest.fixture
+def entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry to own the polls."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _coordinator() -> MagicMock:
+    """Return a stand-in coordinator."""
+    coordinator = MagicMock()
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+def _closest_polls(phases: list[tuple[float, float]]) -> float:
+    """Return the smallest gap in seconds between polls of any two phases."""
+    gaps = []
+    for index, (interval, phase) in enumerate(phases):
+        for other_interval, other_phase in phases[index + 1 :]:
+            period = math.gcd(round(interval), round(other_interval))
+            offset = (phase - other_phase) % period
+            gaps.append(min(offset, period - offset))
+    return min(gaps)
+
+
+async def test_phases_spread_across_intervals(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """Test coordinators with different intervals never poll together."""
+    scheduler = PollScheduler(hass)
+    unsubs = [
+        scheduler.async_register(entry, _coordinator(), timedelta(seconds=seconds))
+        for seconds in (30, 60, 30, 60)
+    ]
+
+    assert scheduler.registered == 4
+    assert _closest_polls(list(scheduler._phases.values())) >= 7
+
+    for unsub in unsubs:
+        unsub()
+    assert scheduler.registered == 0
+
+
+async def test_phase_reused_after_unregister(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """Test a coordinator registered in place of a removed one takes its phase."""
+    scheduler = PollScheduler(hass)
+    unsub_first = scheduler.async_register(entry, _coordinator(), timedelta(seconds=30))
+    unsub_second = scheduler.async_register(
+        entry, _coordinator(), timedelta(seconds=60)
+    )
+    phases = list(scheduler._phases.values())
+
+    unsub_first()
+    unsub_third = scheduler.async_register(entry, _coordinator(), timedelta(seconds=30))
+
+    assert sorted(scheduler._phases.values()) == sorted(phases)
+    unsub_second()
+    unsub_third()
+
+
+async def test_jitter_does_not_drift(
+    hass: HomeAssistant, entry: MockConfigEntry, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polls stay on their phase however much jitter each one gets."""
+    freezer.move_to("2026-01-01 00:00:00+00:00")
+    scheduler = PollScheduler(hass)
+    polled_at: list[float] = []
+    coordinator = _coordinator()
+    coordinator.async_refresh.side_effect = lambda: polled_at.append(time.time())
+
+    with patch(
+        "custom_components.jg_aura.scheduler.random.uniform",
+        return_value=POLL_JITTER_SECONDS,
+    ):
+        unsub = scheduler.async_register(entry, coordinator, timedelta(seconds=30))
+        for _ in range(600):
+            freezer.tick(1)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+    unsub()
+
+    assert len(polled_at) == 19
+    assert {round(at) % 30 for at in polled_at} == {POLL_JITTER_SECONDS}
@@ -0,0 +1,74 @@
+"""Tests for the JGAura services."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.jg_aura.const import DOMAIN
+from custom_components.jg_aura.services import ATTR_CYCLES, SERVICE_PROFILE
+
+from .common import StandInGateway
+
+
+@pytest.fixture
+async def loaded_entry(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+    tmp_path: Path,
+) -> MockConfigEntry:
+    """Set up an entry that saves profiles in a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
+
+
+async def test_profile_saves_report(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry, tmp_path: Path
+) -> None:
+    """Test a profile records the requested cycles and saves the report."""
+    runtime_data = loaded_entry.runtime_data
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE, {ATTR_CYCLES: 2}, blocking=True
+    )
+    assert runtime_data.client.profiler is not None
+    await runtime_data.climate.async_refresh()
+    await runtime_data.climate.async_refresh()
+    await hass.async_block_till_done()
+
+    assert runtime_data.client.profiler is None
+    (path,) = tmp_path.glob(f"{DOMAIN}_profile_*.json")
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["requested_cycles"] == 2
+    assert report["totals"]["climate refresh"]["count"] == 2
+
+    assert await hass.config_entries.async_unload(loaded_entry.entry_id)
+
+
+async def test_profile_already_running(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    """Test a second profile is rejected while one is running."""
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE, {ATTR_CYCLES: 1}, blocking=True
+    )
+
+    with pytest.raises(ServiceValidationError, match="already running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE, {ATTR_CYCLES: 1}, blocking=True
+        )
+
+    await loaded_entry.runtime_data.climate.async_refresh()
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(loaded_entry.entry_id)
@@ -0,0 +1,104 @@
+"""Tests for the JGAura gateway snapshots."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.jg_aura.gateway import Gateway
+from custom_components.jg_aura.hotwater import HotWater
+from custom_components.jg_aura.snapshot import GatewaySnapshot, SnapshotStore
+from custom_components.jg_aura.thermostat import Thermostat
+
+from .common import HOT_WATER_ID
+
+KITCHEN = Thermostat("0001", "Kitchen", False, "High", 19.5, 21)
+LOUNGE = Thermostat("0002", "Lounge", False, "Auto", 17, 18)
+
+
+def _gateway(*thermostats: Thermostat) -> Gateway:
+    """Return a gateway holding the given thermostats."""
+    return Gateway("JG-Gateway", "JG-Gateway", list(thermostats))
+
+
+def _subscribe(store: SnapshotStore) -> list[tuple[int, dict[str, Any]]]:
+    """Subscribe to a store, returning the received versions and diffs."""
+    received: list[tuple[int, dict[str, Any]]] = []
+
+    def _receive(snapshot: GatewaySnapshot, changes: dict[str, Any]) -> None:
+        received.append((snapshot.version, changes))
+
+    store.async_subscribe(_receive)
+    return received
+
+
+def test_version_only_increases_on_change() -> None:
+    """Test publishing unchanged data creates no version and no event."""
+    store = SnapshotStore()
+    received = _subscribe(store)
+
+    store.async_update_thermostats(_gateway(KITCHEN, LOUNGE))
+    store.async_update_thermostats(_gateway(KITCHEN, LOUNGE))
+    store.async_update_hot_water(HotWater(HOT_WATER_ID, True))
+    store.async_update_hot_water(HotWater(HOT_WATER_ID, True))
+
+    assert store.snapshot.version == 2
+    assert [version for version, _changes in received] == [1, 2]
+
+
+def test_diff_holds_only_changed_fields() -> None:
+    """Test a diff carries only the changed fields of the changed zones."""
+    store = SnapshotStore()
+    store.async_update_thermostats(_gateway(KITCHEN, LOUNGE))
+    received = _subscribe(store)
+
+    store.async_update_thermostats(
+        _gateway(
+            Thermostat("0001", "Kitchen", False, "High", 19.5, 22),
+            LOUNGE,
+        )
+    )
+
+    assert received == [(2, {"thermostats": {"0001": {"temp_set_point": 22}}})]
+
+
+def test_diff_lists_removed_zones() -> None:
+    """Test zones that disappear are listed as removed."""
+    store = SnapshotStore()
+    store.async_update_thermostats(_gateway(KITCHEN, LOUNGE))
+    received = _subscribe(store)
+
+    store.async_update_thermostats(_gateway(KITCHEN))
+
+    assert received == [(2, {"removed": ["0002"]})]
+    assert set(store.snapshot.thermostats) == {"0001"}
+
+
+def test_diff_carries_hot_water_changes() -> None:
+    """Test hot water changes, including disabling it, are sent in full."""
+    store = SnapshotStore()
+    store.async_update_hot_water(HotWater(HOT_WATER_ID, True))
+    received = _subscribe(store)
+
+    store.async_update_hot_water(HotWater(HOT_WATER_ID, False))
+    store.async_update_hot_water(None)
+
+    assert received == [
+        (2, {"hot_water": {"id": HOT_WATER_ID, "is_on": False}}),
+        (3, {"hot_water": None}),
+    ]
+
+
+def test_close_ends_subscriptions() -> None:
+    """Test closing calls each subscriber's on_close once and drops them."""
+    store = SnapshotStore()
+    subscriber = Mock()
+    on_close = Mock()
+    unsubscribe = store.async_subscribe(subscriber, on_close)
+
+    store.async_close()
+    unsubscribe()
+    store.async_update_hot_water(HotWater(HOT_WATER_ID, True))
+
+    on_close.assert_called_once_with()
+    subscriber.assert_not_called()
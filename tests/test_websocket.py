@@ -0,0 +1,56 @@
+"""Tests for the JGAura websocket API."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.jg_aura.const import DOMAIN
+
+from .common import SAMPLE_ATTRIBUTES, StandInGateway, zone_block
+
+
+async def test_subscription_sends_diffs_and_ends_on_unload(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    enable_custom_integrations: None,
+    stand_in: StandInGateway,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test a subscription gets the snapshot, then diffs, then a final event."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    store = config_entry.runtime_data.snapshots
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/snapshot/subscribe", "entry_id": config_entry.entry_id}
+    )
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+    assert set(event["snapshot"]["thermostats"]) == {"0001", "0002", "0003"}
+    version = event["version"]
+
+    stand_in.attributes = [
+        ("101", "001", zone_block("0001", 4, 19.5, 22) + zone_block("0002", 1, 17, 18)),
+        *(attribute for attribute in SAMPLE_ATTRIBUTES if attribute[1] != "001"),
+    ]
+    await config_entry.runtime_data.climate.async_refresh()
+    event = (await client.receive_json())["event"]
+    assert event == {
+        "version": version + 1,
+        "diff": {"thermostats": {"0001": {"temp_set_point": 22.0}}},
+    }
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+    async with asyncio.timeout(1):
+        message = await client.receive_json()
+    assert message["type"] == "event"
+    assert message["event"] == {"version": version + 1, "closed": True}
+    assert store._subscriptions == []